@@ -2,12 +2,14 @@
 import os
 import sys
 import time
+import logging
 import inspect
-from datetime import datetime
 import threading
 import copy
 import signal
 from collections import deque, defaultdict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 
 import platform
 
@@ -24,6 +26,16 @@ from ayon_api import (
     get_project_roots_for_site
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
 from .version import __version__
 from .providers.local_drive import LocalDriveHandler
 
@@ -32,10 +44,36 @@ from .utils import (
     SyncStatus,
     SiteAlreadyPresentError,
     SiteSyncStatus,
+    ProjectTaskQueue,
+    clear_linked_representations_cache,
 )
 
 SYNC_ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Response status codes of successful state requests
+_SUCCESS_STATUS_CODES = frozenset({200, 204})
+
+# Sync action and status key with retries by (local is OK, remote is OK)
+_SYNC_ACTION_BY_STATE = {
+    (False, True): (SyncStatus.DO_DOWNLOAD, "localStatus"),
+    (True, False): (SyncStatus.DO_UPLOAD, "remoteStatus"),
+}
+
+
+def _canonical_repre_id(representation_id):
+    """Representation id without dashes as used by site sync server.
+
+    Args:
+        representation_id (str): Representation id.
+
+    Returns:
+        str: Representation id in canonical form.
+
+    """
+    if "-" not in representation_id:
+        return representation_id
+    return representation_id.replace("-", "")
+
 
 class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
     """Addon handling sync of representation files between sites.
@@ -81,9 +119,20 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
     LOCAL_SITE = "local"
     LOG_PROGRESS_SEC = 5  # how often log progress to DB
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
+    SETTINGS_CACHE_TTL = 30  # how long are cached settings valid (in sec)
+    VALIDATE_BATCH_SIZE = 500  # representations processed at once
+    SETTINGS_PREFETCH_WORKERS = 16  # parallel project settings requests
+    ROOTS_CACHE_TTL = 300  # how long are cached studio roots valid (in sec)
+    PROJECT_NAMES_CACHE_TTL = 5  # how long are cached project names valid
+    STATE_UPDATES_BATCH_SIZE = 500  # queued state updates sent at once
+    STATE_UPDATES_FLUSH_SEC = 0.2  # max age of queued state updates
+    REMOVE_FILES_WORKERS = 16  # parallel removal of local files
+    REMOVE_SITES_WORKERS = 8  # parallel site removal without bulk endpoint
+    SYNC_QUERY_WORKERS = 2  # parallel queries of representations to sync
 
     name = "sitesync"
     version = __version__
+    _endpoint_prefix = "addons/{}/{}".format(name, version)
 
     def initialize(self, addon_settings):
         """Called during Addon Manager creation.
@@ -95,24 +144,98 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
 
         # some parts of code need to run sequentially, not in async
         self.lock = None
+        # guards refill of cached settings, reads are lock free
+        self._settings_lock = threading.RLock()
         self._sync_studio_settings = None
+        self._sync_studio_settings_time = 0
         # settings for all enabled projects for sync
         self._sync_project_settings = None
+        self._sync_project_settings_time = 0
         self.sitesync_thread = None  # asyncio requires new thread
 
         self._paused = False
-        self._paused_projects = set()
-        self._paused_representations = set()
+        # immutable snapshots swapped on change, readers don't need lock
+        self._paused_projects = frozenset()
+        self._paused_representations = frozenset()
+        # serializes writers of paused snapshots
+        self._paused_lock = threading.Lock()
         self._anatomies = {}
+        self._local_site_id = None
+        self._site_icons = None
+        # normalized site names derived from settings, by project name
+        self._always_accessible_cache = {}
+        self._alt_site_pairs_cache = {}
+        self._alt_site_pairs_by_fingerprint = {}
+        # alternate sites by site name from studio settings
+        self._alt_site_index = None
+        # provider names by site name from studio settings
+        self._provider_by_site = None
+        # active and remote site names by project name
+        self._working_site_names_cache = {}
+        # sites transformed from settings by id of settings object
+        self._transformed_sites_cache = {}
+        # session used to reset timer via webserver
+        self._reset_session = None
+        # resolved local roots by project and site name
+        self._root_config_cache = {}
+        # studio roots with overrides by project and site name
+        self._studio_roots_cache = {}
+        self._project_names = None
+        self._project_names_time = 0
+        # module cache outlives addon object when addons are reloaded
+        clear_linked_representations_cache()
+
+        # queued representation state updates by project name
+        self._state_updates = defaultdict(list)
+        self._state_updates_sent = {}
+        self._state_updates_lock = threading.Lock()
+
+        # long blocking tasks sharded by project
+        self.long_running_tasks = ProjectTaskQueue()
+        # reused by each sync loop, threads are started on first use
+        self._sync_query_executor = ThreadPoolExecutor(
+            max_workers=self.SYNC_QUERY_WORKERS
+        )
+
+    @property
+    def local_site_id(self):
+        """Site id of this machine, cached on first access.
+
+        Returns:
+            str: Local site id.
+
+        """
+        if self._local_site_id is None:
+            self._local_site_id = get_local_site_id()
+        return self._local_site_id
+
+    def invalidate_local_site_id(self):
+        """Reset cached local site id, e.g. when 'AYON_SITE_ID' changed.
 
-        # list of long blocking tasks
-        self.long_running_tasks = deque()
-        # projects that long tasks are running on
-        self.projects_processed = set()
+        Cached settings contain local site too, so they are invalidated.
+        """
+        self._local_site_id = None
+        self.invalidate_settings_cache()
 
     @property
     def endpoint_prefix(self):
-        return "addons/{}/{}".format(self.name, self.version)
+        return self._endpoint_prefix
+
+    def _get_state_endpoint(self, project_name, *path_parts):
+        """Endpoint of sync state of project.
+
+        Args:
+            project_name (str): Project name.
+            *path_parts (str): Additional parts of path, e.g. representation
+                id and site name.
+
+        Returns:
+            str: Endpoint url.
+
+        """
+        return "/".join(
+            (self._endpoint_prefix, project_name, "state") + path_parts
+        )
 
     def get_plugin_paths(self):
         return {
@@ -122,10 +245,16 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
     def get_site_icons(self):
         """Icons for sites.
 
+        Resources are static for the lifetime of process, result is cached
+        on first call.
+
         Returns:
             dict[str, str]: Path to icon by site.
 
         """
+        if self._site_icons is not None:
+            return self._site_icons
+
         resource_path = os.path.join(
             SYNC_ADDON_DIR, "providers", "resources"
         )
@@ -138,6 +267,7 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
                 "type": "path",
                 "path": os.path.join(resource_path, file_path)
             }
+        self._site_icons = icons
         return icons
 
     def get_launch_hook_paths(self):
@@ -189,11 +319,13 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         if not self.get_sync_project_setting(project_name):
             raise ValueError("Project not configured")
 
+        representation_id = _canonical_repre_id(representation_id)
         if not site_name:
             site_name = self.DEFAULT_SITE
 
+        # only files are needed to build the payload
         representation = get_representation_by_id(
-            project_name, representation_id
+            project_name, representation_id, fields={"files"}
         )
 
         files = representation.get("files", [])
@@ -219,24 +351,39 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
                     self.log.info(msg)
                     raise SiteAlreadyPresentError(msg)
 
-        new_site_files = [
+        payload_dict = {"files": self._get_files_site_state(files, status)}
+
+        self._set_state_sync_state(
+            project_name, representation_id, site_name, payload_dict
+        )
+
+    def _get_files_site_state(self, files, status, timestamp=None):
+        """Initial state of representation files on a site.
+
+        Args:
+            files (list[dict[str, Any]]): Files of representation entity.
+            status (SiteSyncStatus): Status of all files.
+            timestamp (Optional[float]): Time of the state, current time
+                is used if not passed.
+
+        Returns:
+            list[dict[str, Any]]: File states for state endpoint.
+
+        """
+        # same timestamp for all files of the representation
+        if timestamp is None:
+            timestamp = time.time()
+        return [
             {
                 "size": repre_file["size"],
                 "status": status,
-                "timestamp": datetime.now().timestamp(),
+                "timestamp": timestamp,
                 "id": repre_file["id"],
                 "fileHash": repre_file["hash"]
             }
             for repre_file in files
         ]
 
-        payload_dict = {"files": new_site_files}
-        representation_id = representation_id.replace("-", "")
-
-        self._set_state_sync_state(
-            project_name, representation_id, site_name, payload_dict
-        )
-
     def remove_site(
         self,
         project_name,
@@ -253,6 +400,9 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             remove_local_files (bool): remove only files for 'local_id'
                 site
 
+        Returns:
+            bool: Site was removed from representation.
+
         Raises:
             ValueError: Throws if any issue.
 
@@ -260,6 +410,7 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         if not self.get_sync_project_setting(project_name):
             raise ValueError("Project not configured")
 
+        representation_id = _canonical_repre_id(representation_id)
         sync_info = self.get_repre_sync_state(
             project_name,
             representation_id,
@@ -268,21 +419,123 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         if not sync_info:
             msg = "Site {} not found".format(site_name)
             self.log.warning(msg)
-            return
+            return False
 
-        endpoint = "{}/{}/state/{}/{}".format(
-            self.endpoint_prefix,
-            project_name,
-            representation_id,
-            site_name
+        endpoint = self._get_state_endpoint(
+            project_name, representation_id, site_name
         )
 
         response = ayon_api.delete(endpoint)
-        if response.status_code not in [200, 204]:
+        if response.status_code not in _SUCCESS_STATUS_CODES:
             raise RuntimeError("Cannot update status")
 
         if remove_local_files:
             self._remove_local_file(project_name, representation_id, site_name)
+        return True
+
+    def remove_sites(
+        self,
+        project_name,
+        representation_ids,
+        site_name,
+        remove_local_files=False
+    ):
+        """Removes site from multiple representations in project at once.
+
+        Bulk variant of 'remove_site' which needs single server request.
+        Falls back to parallel 'remove_site' calls when server addon does
+        not have the bulk endpoint.
+
+        Args:
+            project_name (str): Project name.
+            representation_ids (Iterable[str]): Representation ids.
+            site_name (str): Name of configured and active site.
+            remove_local_files (bool): Remove files of representations, works
+                only for local site.
+
+        Returns:
+            list[str]: Ids of representations which had the site.
+
+        Raises:
+            ValueError: Throws if any issue.
+
+        """
+        if not self.get_sync_project_setting(project_name):
+            raise ValueError("Project not configured")
+
+        representation_ids = list({
+            _canonical_repre_id(representation_id)
+            for representation_id in representation_ids
+        })
+        if not representation_ids:
+            return []
+
+        endpoint = "{}/{}/remove_site/{}".format(
+            self.endpoint_prefix, project_name, site_name
+        )
+        response = self._post_sync_state(
+            endpoint, {"representationIds": representation_ids}
+        )
+        if response.status_code == 404:
+            return self._remove_sites_one_by_one(
+                project_name,
+                representation_ids,
+                site_name,
+                remove_local_files
+            )
+        if response.status_code != 200:
+            raise RuntimeError("Cannot remove site {}".format(site_name))
+
+        removed_ids = response.data.get("representationIds") or []
+        if not removed_ids or not remove_local_files:
+            return removed_ids
+
+        if self.local_site_id != site_name:
+            self.log.warning(
+                "Cannot remove non local file for {}".format(site_name)
+            )
+            return removed_ids
+
+        if self.get_provider_for_site(site=site_name) != "local_drive":
+            return removed_ids
+
+        # query only files needed for removal
+        representations = get_representations(
+            project_name,
+            representation_ids=removed_ids,
+            fields={"id", "files"}
+        )
+        for representation in representations:
+            self._remove_representation_local_files(
+                project_name, representation, site_name
+            )
+        return removed_ids
+
+    def _remove_sites_one_by_one(
+        self, project_name, representation_ids, site_name, remove_local_files
+    ):
+        self.log.debug(
+            "Bulk site removal is not available, removing one by one"
+        )
+
+        def remove_site(representation_id):
+            return self.remove_site(
+                project_name,
+                representation_id,
+                site_name,
+                remove_local_files=remove_local_files
+            )
+
+        max_workers = min(self.REMOVE_SITES_WORKERS, len(representation_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            removed = list(executor.map(remove_site, representation_ids))
+        return [
+            representation_id
+            for representation_id, is_removed in zip(
+                representation_ids, removed
+            )
+            if is_removed
+        ]
 
     def compute_resource_sync_sites(self, project_name):
         """Get available resource sync sites state for publish process.
@@ -328,7 +581,7 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         attached_sites = {
             local_site: create_metadata(local_site)
         }
-        if remote_site and remote_site not in attached_sites:
+        if remote_site and remote_site != local_site:
             attached_sites[remote_site] = create_metadata(
                 remote_site, created=False
             )
@@ -338,15 +591,17 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         # add skeleton for sites where it should be always synced to
         # usually it would be a backup site which is handled by separate
         # background process
-        for site_name in self._get_always_accessible_sites(project_name):
-            if site_name not in attached_sites:
-                attached_sites[site_name] = (
-                    create_metadata(site_name, created=False))
-        unique_sites = {
-            site["name"]: site
-            for site in attached_sites.values()
-        }
-        return list(unique_sites.values())
+        always_accessible_sites = self._get_always_accessible_sites(
+            project_name
+        )
+        attached_sites.update({
+            site_name: create_metadata(site_name, created=False)
+            for site_name in always_accessible_sites.difference(
+                attached_sites
+            )
+        })
+        # keys are site names, metadata are unique by name already
+        return list(attached_sites.values())
 
     def _get_always_accessible_sites(self, project_name):
         """Sites that synced to as a part of background process.
@@ -356,13 +611,24 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         Example is dropbox site serving as a backup solution
 
         Returns:
-            (list[str]): list of site names
+            (frozenset[str]): set of site names
         """
         sync_settings = self.get_sync_project_setting(project_name)
-        always_accessible_sites = (
-            sync_settings["config"].get("always_accessible_on", [])
+        # cache is valid only for the same settings object
+        cached = self._always_accessible_cache.get(project_name)
+        if cached is not None and cached[0] is sync_settings:
+            return cached[1]
+
+        always_accessible_sites = frozenset(
+            site_name.strip()
+            for site_name in sync_settings["config"].get(
+                "always_accessible_on", []
+            )
+        )
+        self._always_accessible_cache[project_name] = (
+            sync_settings, always_accessible_sites
         )
-        return [site_name.strip() for site_name in always_accessible_sites]
+        return always_accessible_sites
 
     def _add_alternative_sites(self, project_name, attached_sites):
         """Add skeleton document for alternative sites
@@ -379,19 +645,25 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         sync_project_settings = self.get_sync_project_setting(project_name)
         all_sites = sync_project_settings["sites"]
 
-        alt_site_pairs = self._get_alt_site_pairs(all_sites)
-
-        for site_name in all_sites.keys():
-            # Get alternate sites (stripped names) for this site name
-            alt_sites = {
-                site.strip()
-                for site in alt_site_pairs.get(site_name)
+        # cache is valid only for the same settings object
+        cached = self._alt_site_pairs_cache.get(project_name)
+        if cached is not None and cached[0] is all_sites:
+            alt_site_pairs = cached[1]
+        else:
+            # Alternate sites for each configured site name, sites without
+            #   alternatives are skipped
+            alt_site_pairs = {
+                site_name: alt_sites
+                for site_name, alt_sites in self._get_alt_site_pairs(
+                    all_sites
+                ).items()
+                if alt_sites and site_name in all_sites
             }
+            self._alt_site_pairs_cache[project_name] = (
+                all_sites, alt_site_pairs
+            )
 
-            # If no alternative sites we don't need to add
-            if not alt_sites:
-                continue
-
+        for site_name, alt_sites in alt_site_pairs.items():
             # Take a copy of data of the first alternate site that is already
             # defined as an attached site to match the same state.
             match_meta = next(
@@ -405,11 +677,9 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             if not match_meta:
                 continue
 
-            alt_site_meta = copy.deepcopy(match_meta)
-            alt_site_meta["name"] = site_name
-
             # Note: We change mutable `attached_site` dict in-place
-            attached_sites[site_name] = alt_site_meta
+            #   metadata are flat so shallow copy is enough
+            attached_sites[site_name] = {**match_meta, "name": site_name}
 
         return attached_sites
 
@@ -419,16 +689,31 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         If `site` has alternative site, it means that alt_site has 'site' as
         alternative site
 
+        Result is memoized by configured alternative sites, it is used on
+        each publish but changes only with settings.
+
         Args:
             conf_sites (dict)
 
         Returns:
-            dict[str, list[str]]: {'site': [alternative sites]...}
+            dict[str, frozenset[str]]: {'site': {alternative sites}...}
+                Site names are stripped.
 
         """
+        fingerprint = tuple(
+            (site_name, tuple(sorted(site_info.get("alternative_sites", []))))
+            for site_name, site_info in conf_sites.items()
+        )
+        cached = self._alt_site_pairs_by_fingerprint.get(fingerprint)
+        if cached is not None:
+            return cached
+
         alt_site_pairs = defaultdict(set)
         for site_name, site_info in conf_sites.items():
-            alt_sites = set(site_info.get("alternative_sites", []))
+            alt_sites = {
+                site.strip()
+                for site in site_info.get("alternative_sites", [])
+            }
             alt_site_pairs[site_name].update(alt_sites)
 
             for alt_site in alt_sites:
@@ -452,7 +737,12 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
                         alt_sites.add(alt_alt_site)
                         sites_queue.append(alt_alt_site)
 
-        return alt_site_pairs
+        output = {
+            site_name: frozenset(alt_sites)
+            for site_name, alt_sites in alt_site_pairs.items()
+        }
+        self._alt_site_pairs_by_fingerprint[fingerprint] = output
+        return output
 
     def clear_project(self, project_name, site_name):
         """
@@ -460,24 +750,36 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
 
             Works only on real local sites, not on 'studio'
         """
+        if not self.get_sync_project_setting(project_name):
+            raise ValueError("Project not configured")
 
-        # TODO implement
-        self.log.warning("Method 'clear_project' is not implemented.")
-
-        # query = {
-        #     "type": "representation",
-        #     "files.sites.name": site_name
-        # }
-        #
-        # # TODO currently not possible to replace with get_representations
-        # representations = list(
-        #     self.connection.database[project_name].find(query))
-        # if not representations:
-        #     self.log.debug("No repre found")
-        #     return
-        #
-        # for repre in representations:
-        #     self.remove_site(project_name, repre.get("_id"), site_name, True)
+        if site_name == self.DEFAULT_SITE:
+            raise ValueError("Cannot clear '{}' site".format(site_name))
+
+        # single call removes site from all representations on server
+        endpoint = self._get_state_endpoint(project_name, site_name)
+        response = ayon_api.delete(endpoint)
+        if response.status_code != 200:
+            raise RuntimeError("Cannot clear site {}".format(site_name))
+
+        representation_ids = response.data.get("representationIds")
+        if not representation_ids:
+            self.log.debug("No repre found")
+            return
+
+        if self.local_site_id != site_name:
+            return
+
+        # query only files needed for removal
+        representations = get_representations(
+            project_name,
+            representation_ids=representation_ids,
+            fields={"id", "files"}
+        )
+        for representation in representations:
+            self._remove_representation_local_files(
+                project_name, representation, site_name
+            )
 
     # TODO hook to some trigger - no Sync Queue anymore
     def validate_project(self, project_name, site_name, reset_missing=False):
@@ -495,60 +797,78 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         self.log.debug("Validation of {} for {} started".format(
             project_name, site_name
         ))
-        repre_entities = list(get_representations(project_name))
-        if not repre_entities:
-            self.log.debug("No repre found")
-            return
-
+        # stream representations from server and process them in batches
+        #   instead of loading whole project into memory
+        repre_entities = get_representations(
+            project_name, fields={"id", "files"}
+        )
         sites_added = 0
         sites_reset = 0
-        repre_ids = [repre["id"] for repre in repre_entities]
-        repre_states = self.get_representations_sync_state(
-            project_name, repre_ids, site_name, site_name)
-
-        for repre_entity in repre_entities:
-            repre_id = repre_entity["id"]
-            is_on_site = False
-            repre_state = repre_states.get(repre_id)
-            if repre_state:
-                is_on_site = repre_state[0] == SiteSyncStatus.OK
-            for repre_file in repre_entity.get("files", []):
-                file_path = repre_file.get("path", "")
-                local_file_path = self.get_local_file_path(
-                    project_name, site_name, file_path
-                )
+        repre_count = 0
+        while True:
+            repre_batch = list(
+                islice(repre_entities, self.VALIDATE_BATCH_SIZE)
+            )
+            if not repre_batch:
+                break
+            repre_count += len(repre_batch)
 
-                file_exists = (
-                    local_file_path and os.path.exists(local_file_path)
-                )
-                if not is_on_site:
-                    if file_exists:
-                        self.log.debug(
-                            f"Adding presence on site '{site_name}' for "
-                            f"'{repre_id}'"
-                        )
-                        self.add_site(
-                            project_name,
-                            repre_id,
-                            site_name=site_name,
-                            file_id=repre_file["id"],
-                            force=True,
-                            status=SiteSyncStatus.OK
-                        )
-                        sites_added += 1
-                else:
-                    if not file_exists and reset_missing:
-                        self.log.debug(
-                            "Resetting site {} for {}".format(
-                                site_name, repre_id
-                            ))
-                        self.reset_site_on_representation(
-                            project_name,
-                            repre_id,
-                            site_name=site_name,
-                            file_id=repre_file["_id"]
-                        )
-                        sites_reset += 1
+            repre_ids = [repre["id"] for repre in repre_batch]
+            repre_states = self.get_representations_sync_state(
+                project_name,
+                repre_ids,
+                site_name,
+                site_name,
+                pageLength=len(repre_ids)
+            )
+
+            for repre_entity in repre_batch:
+                repre_id = repre_entity["id"]
+                is_on_site = False
+                repre_state = repre_states.get(repre_id)
+                if repre_state:
+                    is_on_site = repre_state[0] == SiteSyncStatus.OK
+                for repre_file in repre_entity.get("files", []):
+                    file_path = repre_file.get("path", "")
+                    local_file_path = self.get_local_file_path(
+                        project_name, site_name, file_path
+                    )
+
+                    file_exists = (
+                        local_file_path and os.path.exists(local_file_path)
+                    )
+                    if not is_on_site:
+                        if file_exists:
+                            self.log.debug(
+                                f"Adding presence on site '{site_name}' for "
+                                f"'{repre_id}'"
+                            )
+                            self.add_site(
+                                project_name,
+                                repre_id,
+                                site_name=site_name,
+                                file_id=repre_file["id"],
+                                force=True,
+                                status=SiteSyncStatus.OK
+                            )
+                            sites_added += 1
+                    else:
+                        if not file_exists and reset_missing:
+                            self.log.debug(
+                                "Resetting site {} for {}".format(
+                                    site_name, repre_id
+                                ))
+                            self.reset_site_on_representation(
+                                project_name,
+                                repre_id,
+                                site_name=site_name,
+                                file_id=repre_file["id"]
+                            )
+                            sites_reset += 1
+
+        if not repre_count:
+            self.log.debug("No repre found")
+            return
 
         if sites_added % 100 == 0:
             self.log.debug("Sites added {}".format(sites_added))
@@ -575,12 +895,15 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             site_name (str): Site name 'gdrive', 'studio' etc.
 
         """
+        representation_id = _canonical_repre_id(representation_id)
         self.log.info("Pausing SiteSync for {}".format(representation_id))
-        self._paused_representations.add(representation_id)
-        repre_entity = get_representation_by_id(
-            project_name, representation_id
+        with self._paused_lock:
+            self._paused_representations = (
+                self._paused_representations | {representation_id}
+            )
+        self._update_repre_pause(
+            project_name, representation_id, site_name, True
         )
-        self.update_db(project_name, repre_entity, site_name, pause=True)
 
     # TODO hook to some trigger - no Sync Queue anymore
     def unpause_representation(
@@ -595,16 +918,36 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             representation_id (str): Representation id.
             site_name (str): Site name 'gdrive', 'studio' etc.
         """
+        representation_id = _canonical_repre_id(representation_id)
         self.log.info("Unpausing SiteSync for {}".format(representation_id))
-        try:
-            self._paused_representations.remove(representation_id)
-        except KeyError:
-            pass
+        with self._paused_lock:
+            self._paused_representations = (
+                self._paused_representations - {representation_id}
+            )
         # self.paused_representations is not persistent
-        repre_entity = get_representation_by_id(
-            project_name, representation_id
+        self._update_repre_pause(
+            project_name, representation_id, site_name, False
+        )
+
+    def _update_repre_pause(
+        self, project_name, representation_id, site_name, pause
+    ):
+        # site is queried as local site, its status is in 'localStatus'
+        repre_status = self.get_repre_sync_state(
+            project_name, representation_id, site_name
+        )
+        if repre_status is None:
+            self.log.debug("Representation {} is not on site {}".format(
+                representation_id, site_name
+            ))
+            return
+        self.update_db(
+            project_name,
+            repre_status,
+            site_name,
+            side="local",
+            pause=pause
         )
-        self.update_db(project_name, repre_entity, site_name, pause=False)
 
     def is_representation_paused(
         self, representation_id, check_parents=False, project_name=None
@@ -623,14 +966,18 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             bool: Is representation paused now.
 
         """
-        is_paused = representation_id in self._paused_representations
+        # cheapest checks first, nothing is paused in most cases
         if check_parents and project_name:
-            is_paused = (
-                is_paused
-                or self.is_project_paused(project_name)
-                or self.is_paused()
-            )
-        return is_paused
+            if self._paused or project_name in self._paused_projects:
+                return True
+
+        paused_representations = self._paused_representations
+        if not paused_representations:
+            return False
+        return (
+            _canonical_repre_id(representation_id)
+            in paused_representations
+        )
 
     # TODO hook to some trigger - no Sync Queue anymore
     def pause_project(self, project_name):
@@ -641,7 +988,8 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
 
         """
         self.log.info("Pausing SiteSync for {}".format(project_name))
-        self._paused_projects.add(project_name)
+        with self._paused_lock:
+            self._paused_projects = self._paused_projects | {project_name}
 
     # TODO hook to some trigger - no Sync Queue anymore
     def unpause_project(self, project_name):
@@ -654,10 +1002,8 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
 
         """
         self.log.info("Unpausing SiteSync for {}".format(project_name))
-        try:
-            self._paused_projects.remove(project_name)
-        except KeyError:
-            pass
+        with self._paused_lock:
+            self._paused_projects = self._paused_projects - {project_name}
 
     def is_project_paused(self, project_name, check_parents=False):
         """Is project sync paused.
@@ -671,10 +1017,9 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             bool: Is project paused.
 
         """
-        is_paused = project_name in self._paused_projects
-        if check_parents:
-            is_paused = is_paused or self.is_paused()
-        return is_paused
+        if check_parents and self._paused:
+            return True
+        return project_name in self._paused_projects
 
     # TODO hook to some trigger - no Sync Queue anymore
     def pause_server(self):
@@ -743,23 +1088,56 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             str: Site name.
 
         """
-        active_site_type = self.get_active_site_type(project_name)
-        if active_site_type == self.LOCAL_SITE:
-            return get_local_site_id()
-        return active_site_type
+        if not self.enabled:
+            return "studio"
+        return self._get_working_site_names(project_name)[0]
 
     # remote site
     def get_remote_site(self, project_name):
         """Remote (theirs) site for project from settings."""
+        return self._get_working_site_names(project_name)[1]
+
+    def _get_working_site_names(self, project_name):
+        """Active and remote site names of project.
+
+        Values are cached per project settings object, so they are resolved
+        only once after each settings refill.
+
+        Args:
+            project_name (str): Project name.
+
+        Returns:
+            tuple[str, str]: Active and remote site name.
+
+        """
         sync_project_settings = self.get_sync_project_setting(project_name)
+        local_site_id = self.local_site_id
+        cached = self._working_site_names_cache.get(project_name)
+        if (
+            cached is not None
+            and cached[0] is sync_project_settings
+            and cached[1] == local_site_id
+        ):
+            return cached[2]
+
+        local_setting = sync_project_settings["local_setting"]
+        config = sync_project_settings["config"]
+        active_site = "studio"
+        if sync_project_settings["enabled"]:
+            active_site = (
+                local_setting.get("active_site") or config["active_site"]
+            )
         remote_site = (
-            sync_project_settings["local_setting"].get("remote_site")
-            or sync_project_settings["config"]["remote_site"]
+            local_setting.get("remote_site") or config["remote_site"]
         )
-        if remote_site == self.LOCAL_SITE:
-            return get_local_site_id()
-
-        return remote_site
+        site_names = tuple(
+            local_site_id if site_name == self.LOCAL_SITE else site_name
+            for site_name in (active_site, remote_site)
+        )
+        self._working_site_names_cache[project_name] = (
+            sync_project_settings, local_site_id, site_names
+        )
+        return site_names
 
     def get_site_root_overrides(
         self, project_name, site_name, local_settings=None
@@ -784,7 +1162,7 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         # Validate that site name is valid
         if site_name not in ("studio", "local"):
             # Consider local site id as 'local'
-            if site_name != get_local_site_id():
+            if site_name != self.local_site_id:
                 raise ValueError((
                     "Root overrides are available only for"
                     " default sites not for \"{}\""
@@ -815,9 +1193,8 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             str: Normalized site name.
 
         """
-        if site_name == get_local_site_id():
-            site_name = self.LOCAL_SITE
-
+        if site_name == self.local_site_id:
+            return self.LOCAL_SITE
         return site_name
 
     def is_representation_on_site(
@@ -845,17 +1222,21 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         if not representation_status:
             return False
 
-        if site_name == get_local_site_id():
+        if site_name == self.local_site_id:
             status = representation_status["localStatus"]
         else:
             status = representation_status["remoteStatus"]
 
+        # synchronized representation doesn't need retries check
+        if status["status"] == SiteSyncStatus.OK:
+            return True
+
         if max_retries:
             tries = status.get("retries", 0)
             if tries >= max_retries:
                 raise ValueError("Failed too many times")
 
-        return status["status"] == SiteSyncStatus.OK
+        return False
 
     def _reset_timer_with_rest_api(self):
         # POST to webserver sites to add to representations
@@ -868,25 +1249,38 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             webserver_url
         )
 
-        try:
-            import requests
-        except Exception:
+        if requests is None:
             self.log.warning(
                 "Couldn't add sites to representations "
                 "('requests' is not available)"
             )
             return
 
-        requests.post(rest_api_url)
+        # keep connection alive between resets
+        if self._reset_session is None:
+            self._reset_session = requests.Session()
+        self._reset_session.post(rest_api_url, timeout=5)
 
     def get_enabled_projects(self):
         """Returns list of projects which have SiteSync enabled."""
         enabled_projects = []
+        if not self.enabled:
+            return enabled_projects
+
+        project_names = self._get_project_names()
+        # take snapshot once instead of accessing property for each project
+        sync_project_settings = self.sync_project_settings
+        if any(
+            not sync_project_settings.get(project_name)
+            for project_name in project_names
+        ):
+            self.set_sync_project_settings()
+            sync_project_settings = self.sync_project_settings
 
-        if self.enabled:
-            for project_name in get_project_names():
-                if self.is_project_enabled(project_name):
-                    enabled_projects.append(project_name)
+        for project_name in project_names:
+            project_settings = sync_project_settings.get(project_name)
+            if project_settings and project_settings.get("enabled"):
+                enabled_projects.append(project_name)
 
         return enabled_projects
 
@@ -931,22 +1325,9 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             file_id (str): File id of file handled.
 
         """
-        sites = self._transform_sites_from_settings(self.sync_studio_settings)
-        sites[self.DEFAULT_SITE] = {
-            "provider": "local_drive",
-            "alternative_sites": []
-        }
-
-        alternate_sites = []
-        for site_name, site_info in sites.items():
-            conf_alternative_sites = site_info.get("alternative_sites", [])
-            if processed_site in conf_alternative_sites:
-                alternate_sites.append(site_name)
-                continue
-            if processed_site == site_name and conf_alternative_sites:
-                alternate_sites.extend(conf_alternative_sites)
-                continue
-
+        alternate_sites = self._get_alternate_sites_index().get(
+            processed_site
+        )
         if not alternate_sites:
             return
 
@@ -964,7 +1345,6 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
 
         payload_dict = {"files": sync_state["files"]}
 
-        alternate_sites = set(alternate_sites)
         for alt_site in alternate_sites:
             self.log.debug("Adding alternate {} to {}".format(
                 alt_site, representation_id))
@@ -976,6 +1356,45 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
                 payload_dict
             )
 
+    def _get_alternate_sites_index(self):
+        """Alternate sites by site name from studio settings.
+
+        Site is alternate of processed site if it has processed site in its
+        'alternative_sites', or if it is listed in 'alternative_sites' of
+        processed site. Index is rebuilt only when studio settings change.
+
+        Returns:
+            dict[str, frozenset[str]]: Alternate sites by site name.
+
+        """
+        studio_settings = self.sync_studio_settings
+        cached = self._alt_site_index
+        if cached is not None and cached[0] is studio_settings:
+            return cached[1]
+
+        sites = {
+            **self._transform_sites_from_settings(studio_settings),
+            self.DEFAULT_SITE: {
+                "provider": "local_drive",
+                "alternative_sites": frozenset()
+            }
+        }
+
+        alternate_sites_by_site = defaultdict(set)
+        for site_name, site_info in sites.items():
+            conf_alternative_sites = site_info.get("alternative_sites", [])
+            for alt_site in conf_alternative_sites:
+                alternate_sites_by_site[alt_site].add(site_name)
+            alternate_sites_by_site[site_name].update(conf_alternative_sites)
+
+        index = {
+            site_name: frozenset(alt_sites)
+            for site_name, alt_sites in alternate_sites_by_site.items()
+            if alt_sites
+        }
+        self._alt_site_index = (studio_settings, index)
+        return index
+
     # TODO - for Loaders
     def get_repre_info_for_versions(
         self, project_name, version_ids, active_site, remote_site
@@ -1016,35 +1435,26 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             }
             for version_id in version_ids
         }
-        repre_states_by_version_id = defaultdict(list)
+        # single pass aggregation directly into output items
+        status_ok = SiteSyncStatus.OK
         for repre_state in repre_states:
-            version_id = repre_state["versionId"]
-            repre_states_by_version_id[version_id].append(repre_state)
-
-        for version_id, repre_states in repre_states_by_version_id.items():
-            repre_info = repre_info_by_version_id[version_id]
-            repre_info["repre_count"] = len(repre_states)
-            repre_info["avail_repre_local"] = sum(
-                self._is_available(repre_state, "localStatus")
-                for repre_state in repre_states
+            repre_info = repre_info_by_version_id.get(
+                repre_state["versionId"]
+            )
+            if repre_info is None:
+                continue
+            repre_info["repre_count"] += 1
+            # bool is added as 0 or 1
+            repre_info["avail_repre_local"] += (
+                repre_state["localStatus"]["status"] == status_ok
             )
-            repre_info["avail_repre_remote"] = sum(
-                self._is_available(repre_state, "remoteStatus")
-                for repre_state in repre_states
+            repre_info["avail_repre_remote"] += (
+                repre_state["remoteStatus"]["status"] == status_ok
             )
 
         return list(repre_info_by_version_id.values())
     # --- End of Public API ---
 
-    def _is_available(self, repre, status):
-        """Helper to decide if repre is download/uploaded on site.
-
-        Returns:
-            int: 1 if available, 0 if not.
-
-        """
-        return int(repre[status]["status"] == SiteSyncStatus.OK)
-
     def get_local_file_path(self, project_name, site_name, file_path):
         """Externalized for app.
 
@@ -1058,10 +1468,37 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
 
         """
         handler = LocalDriveHandler(project_name, site_name)
-        local_file_path = handler.resolve_path(file_path)
+        root_config = self._get_local_root_config(
+            project_name, site_name, handler
+        )
+        local_file_path = handler.resolve_path(
+            file_path, root_config=root_config
+        )
 
         return local_file_path
 
+    def _get_local_root_config(self, project_name, site_name, handler):
+        """Cached root values of local drive site.
+
+        Resolving roots requires Anatomy which is expensive to be done for
+        each file, values are cached for 'SETTINGS_CACHE_TTL' seconds.
+
+        Args:
+            project_name (str): Project name.
+            site_name (str): Site name.
+            handler (LocalDriveHandler): Handler of the site.
+
+        Returns:
+            dict[str, Any]: Root config usable in 'resolve_path'.
+
+        """
+        key = (project_name, site_name)
+        cached = self._root_config_cache.get(key)
+        if cached is None or self._is_settings_cache_expired(*cached):
+            cached = (handler.get_roots_config(), time.time())
+            self._root_config_cache[key] = cached
+        return cached[0]
+
     def tray_init(self):
         """Initialization of Site Sync Server for Tray.
 
@@ -1105,6 +1542,7 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         Called from Addon Manager
         """
         self.server_exit()
+        self._sync_query_executor.shutdown(wait=False)
 
     def server_exit(self):
         if not self.sitesync_thread:
@@ -1141,21 +1579,109 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         """
         from ayon_core.pipeline import Anatomy
 
-        return self._anatomies.get(project_name) or Anatomy(project_name)
+        anatomy = self._anatomies.get(project_name)
+        if anatomy is None:
+            anatomy = Anatomy(project_name)
+            self._anatomies[project_name] = anatomy
+        return anatomy
 
-    @property
-    def sync_studio_settings(self):
-        if self._sync_studio_settings is None:
-            self._sync_studio_settings = (
-                get_studio_settings().get(self.name)
-            )
+    def _get_project_names(self):
+        """Project names cached for 'PROJECT_NAMES_CACHE_TTL' seconds.
 
-        return self._sync_studio_settings
+        Multiple callers usually ask for project names right after each
+        other, short cache avoids repeated server requests.
 
-    @property
-    def sync_project_settings(self):
-        if self._sync_project_settings is None:
-            self.set_sync_project_settings()
+        Returns:
+            list[str]: Project names.
+
+        """
+        project_names = self._project_names
+        if (
+            project_names is None
+            or time.time() - self._project_names_time
+            > self.PROJECT_NAMES_CACHE_TTL
+        ):
+            project_names = list(get_project_names())
+            self._project_names = project_names
+            self._project_names_time = time.time()
+        return list(project_names)
+
+    def _is_settings_cache_expired(self, value, cache_time):
+        """Cached settings value must be refilled.
+
+        Args:
+            value (Union[dict, None]): Cached settings value.
+            cache_time (float): Time when value was cached.
+
+        Returns:
+            bool: Value is not cached or is older than 'SETTINGS_CACHE_TTL'.
+
+        """
+        return (
+            value is None
+            or time.time() - cache_time > self.SETTINGS_CACHE_TTL
+        )
+
+    def invalidate_settings_cache(self, project_name=None):
+        """Force refetch of cached settings on next access.
+
+        Project settings are cached for all projects at once, invalidating
+        single project expires whole project cache but keeps studio settings.
+
+        Args:
+            project_name (Optional[str]): Project which settings changed,
+                all cached settings are invalidated if not passed.
+
+        """
+        with self._settings_lock:
+            self._sync_project_settings_time = 0
+            self._always_accessible_cache.clear()
+            self._alt_site_pairs_cache.clear()
+            self._alt_site_pairs_by_fingerprint.clear()
+            self._alt_site_index = None
+            self._provider_by_site = None
+            self._working_site_names_cache.clear()
+            self._transformed_sites_cache.clear()
+            self._root_config_cache.clear()
+            if project_name is None:
+                self._sync_studio_settings_time = 0
+                self._studio_roots_cache.clear()
+                self._project_names = None
+                clear_linked_representations_cache()
+
+    @property
+    def sync_studio_settings(self):
+        studio_settings = self._sync_studio_settings
+        if not self._is_settings_cache_expired(
+            studio_settings, self._sync_studio_settings_time
+        ):
+            return studio_settings
+
+        with self._settings_lock:
+            # other thread might have refilled the cache meanwhile
+            studio_settings = self._sync_studio_settings
+            if self._is_settings_cache_expired(
+                studio_settings, self._sync_studio_settings_time
+            ):
+                # empty dict is cached too, 'None' would cause request
+                #   on each access
+                studio_settings = get_studio_settings().get(self.name) or {}
+                self._sync_studio_settings = studio_settings
+                self._sync_studio_settings_time = time.time()
+        return studio_settings
+
+    @property
+    def sync_project_settings(self):
+        if self._is_settings_cache_expired(
+            self._sync_project_settings, self._sync_project_settings_time
+        ):
+            with self._settings_lock:
+                # other thread might have refilled the cache meanwhile
+                if self._is_settings_cache_expired(
+                    self._sync_project_settings,
+                    self._sync_project_settings_time
+                ):
+                    self.set_sync_project_settings()
 
         return self._sync_project_settings
 
@@ -1166,10 +1692,15 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
                 exclude_locals (bool): ignore overrides from Local Settings
             For performance
         """
-        sync_project_settings = self._prepare_sync_project_settings(
-            exclude_locals)
+        with self._settings_lock:
+            # previous settings objects are not used anymore
+            self._transformed_sites_cache.clear()
+            self._alt_site_pairs_by_fingerprint.clear()
+            sync_project_settings = self._prepare_sync_project_settings(
+                exclude_locals)
 
-        self._sync_project_settings = sync_project_settings
+            self._sync_project_settings = sync_project_settings
+            self._sync_project_settings_time = time.time()
 
     def _prepare_sync_project_settings(self, exclude_locals):
         sync_project_settings = {}
@@ -1177,26 +1708,55 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         sites = self._transform_sites_from_settings(
             self.sync_studio_settings)
 
-        project_names = get_project_names()
-        for project_name in project_names:
-            project_sites = copy.deepcopy(sites)
-            project_settings = get_addon_project_settings(
-                self.name, self.version, project_name)
+        project_names = self._get_project_names()
+        if project_names:
+            # each project needs multiple server requests, fetch them
+            #   concurrently to hide network latency
+            max_workers = min(
+                self.SETTINGS_PREFETCH_WORKERS, len(project_names)
+            )
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                sync_project_settings = dict(zip(
+                    project_names,
+                    executor.map(
+                        lambda project_name: self._prepare_project_settings(
+                            project_name, sites
+                        ),
+                        project_names
+                    )
+                ))
 
-            project_sites.update(self._get_default_site_configs(
-                project_settings["enabled"], project_name, project_settings
-            ))
+        if not sync_project_settings:
+            self.log.info("No enabled and configured projects for sync.")
+        return sync_project_settings
 
-            project_sites.update(
-                self._transform_sites_from_settings(project_settings))
+    def _prepare_project_settings(self, project_name, studio_sites):
+        """Prepare sitesync settings of single project.
 
-            project_settings["sites"] = project_sites
+        Args:
+            project_name (str): Project name.
+            studio_sites (dict[str, dict]): Sites configured in studio
+                settings.
 
-            sync_project_settings[project_name] = project_settings
+        Returns:
+            dict[str, Any]: Project settings with all sites.
 
-        if not sync_project_settings:
-            self.log.info("No enabled and configured projects for sync.")
-        return sync_project_settings
+        """
+        # sites are only replaced as a whole and read by providers, site
+        #   dicts of studio are shared by all projects to keep memory low
+        project_sites = dict(studio_sites)
+        project_settings = get_addon_project_settings(
+            self.name, self.version, project_name)
+
+        project_sites.update(self._get_default_site_configs(
+            project_settings["enabled"], project_name, project_settings
+        ))
+
+        project_sites.update(
+            self._transform_sites_from_settings(project_settings))
+
+        project_settings["sites"] = project_sites
+        return project_settings
 
     def get_sync_project_setting(
         self, project_name, exclude_locals=False, cached=True
@@ -1232,7 +1792,14 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         """Transforms list of 'sites' from Setting to dict.
 
         It processes both System and Project Settings as they have same format.
+
+        Output is cached by identity of 'settings' object, returned value
+        must not be modified.
         """
+        cached = self._transformed_sites_cache.get(id(settings))
+        if cached is not None and cached[0] is settings:
+            return cached[1]
+
         sites = {}
         if not self.enabled:
             return sites
@@ -1244,14 +1811,43 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             )
             configured_site = {
                 "enabled": True,
-                "alternative_sites": whole_site_info["alternative_sites"],
+                # frozenset for O(1) membership checks of alternative sites
+                "alternative_sites": frozenset(
+                    whole_site_info["alternative_sites"]
+                ),
                 "root": provider_specific.pop("roots", None)
             }
             configured_site.update(provider_specific)
 
             sites[site_name] = configured_site
+
+        self._transformed_sites_cache[id(settings)] = (settings, sites)
         return sites
 
+    def _get_cached_project_roots_for_site(self, project_name, site_name):
+        """Cached studio roots of project with overrides for site.
+
+        Roots are changed rarely and require 2 server requests, values are
+        cached for 'ROOTS_CACHE_TTL' seconds.
+
+        Args:
+            project_name (str): Project name.
+            site_name (str): Site name.
+
+        Returns:
+            dict[str, str]: Roots by root name.
+
+        """
+        key = (project_name, site_name)
+        cached = self._studio_roots_cache.get(key)
+        if cached is None or time.time() - cached[1] > self.ROOTS_CACHE_TTL:
+            cached = (
+                self._get_project_roots_for_site(project_name, site_name),
+                time.time()
+            )
+            self._studio_roots_cache[key] = cached
+        return dict(cached[0])
+
     def _get_project_roots_for_site(self, project_name, site_name=None):
         """Returns projects roots and their overrides."""
         # overrides for Studio site for particular user
@@ -1259,7 +1855,7 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         # ayon_api.get_project_roots_by_site returns only overrides.
         # Should be replaced when ayon_api implements `siteRoots` method
         if not site_name:
-            site_name = get_local_site_id()
+            site_name = self.local_site_id
         platform_name = platform.system().lower()
         roots = ayon_api.get(
             f"projects/{project_name}/siteRoots",
@@ -1287,36 +1883,35 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             project_settings (Optional[dict]): Project settings.
 
         """
-        local_site_id = get_local_site_id()
-        roots = self._get_project_roots_for_site(project_name, local_site_id)
-        studio_config = {
+        local_site_id = self.local_site_id
+        base_config = {
             "enabled": True,
             "provider": "local_drive",
-            "root": roots
+            "root": None
         }
-        all_sites = {self.DEFAULT_SITE: studio_config}
-        if sync_enabled:
-            roots = project_settings["local_setting"]["local_roots"]
-            local_site_dict = {
-                "enabled": True,
-                "provider": "local_drive",
-                "root": roots
-            }
-            all_sites[local_site_id] = local_site_dict
-            # duplicate values for normalized local name
-            all_sites["local"] = local_site_dict
+        all_sites = {self.DEFAULT_SITE: base_config}
+        if not sync_enabled:
+            return all_sites
+
+        # studio roots require 2 server requests, they are used only when
+        #   sync is enabled for the project
+        base_config["root"] = self._get_cached_project_roots_for_site(
+            project_name, local_site_id
+        )
+        local_site_dict = dict(
+            base_config,
+            root=project_settings["local_setting"]["local_roots"]
+        )
+        all_sites[local_site_id] = local_site_dict
+        # duplicate values for normalized local name
+        all_sites["local"] = dict(local_site_dict)
         return all_sites
 
     def get_provider_for_site(self, project_name=None, site=None):
         """Get provider name for site (unique name across all projects)."""
-        sites = {
-            self.DEFAULT_SITE: "local_drive",
-            self.LOCAL_SITE: "local_drive",
-            get_local_site_id(): "local_drive"
-        }
-
-        if site in sites.keys():
-            return sites[site]
+        local_site_id = self.local_site_id
+        if site in (self.DEFAULT_SITE, self.LOCAL_SITE, local_site_id):
+            return "local_drive"
 
         # backward compatibility
         if project_name:
@@ -1330,11 +1925,40 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             if provider:
                 return provider
 
-        sync_sett = self.sync_studio_settings
-        for site_config in sync_sett.get("sites"):
-            sites[site_config["name"]] = site_config["provider"]
+        return self._get_provider_by_site().get(site, "N/A")
+
+    def _get_provider_by_site(self):
+        """Provider names by site name from studio settings.
 
-        return sites.get(site, "N/A")
+        Map is rebuilt only when studio settings or local site id change.
+
+        Returns:
+            dict[str, str]: Provider name by site name.
+
+        """
+        studio_settings = self.sync_studio_settings
+        local_site_id = self.local_site_id
+        cached = self._provider_by_site
+        if (
+            cached is not None
+            and cached[0] is studio_settings
+            and cached[1] == local_site_id
+        ):
+            return cached[2]
+
+        provider_by_site = {
+            site_config["name"]: site_config["provider"]
+            for site_config in studio_settings.get("sites")
+        }
+        provider_by_site.update({
+            self.DEFAULT_SITE: "local_drive",
+            self.LOCAL_SITE: "local_drive",
+            local_site_id: "local_drive"
+        })
+        self._provider_by_site = (
+            studio_settings, local_site_id, provider_by_site
+        )
+        return provider_by_site
 
     @time_function
     def get_sync_representations(
@@ -1364,12 +1988,9 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             active_site, remote_site
         ))
 
-        endpoint = "{}/{}/state".format(
-            self.endpoint_prefix, project_name
-        )
+        endpoint = self._get_state_endpoint(project_name)
 
-        # get to upload
-        kwargs = {
+        upload_kwargs = {
             "localSite": active_site,
             "remoteSite": remote_site,
             "localStatusFilter": [SiteSyncStatus.OK],
@@ -1377,30 +1998,45 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
                 SiteSyncStatus.QUEUED, SiteSyncStatus.FAILED
             ]
         }
+        download_kwargs = {
+            "localSite": active_site,
+            "remoteSite": remote_site,
+            "localStatusFilter": [
+                SiteSyncStatus.QUEUED, SiteSyncStatus.FAILED
+            ],
+            "remoteStatusFilter": [SiteSyncStatus.OK]
+        }
 
-        response = ayon_api.get(endpoint, **kwargs)
-        if response.status_code not in [200, 204]:
-            raise RuntimeError(
-                "Cannot get representations for sync with code {}".format(
-                    response.status_code
+        # query both directions at once to save one round trip
+        download_future = self._sync_query_executor.submit(
+            ayon_api.get, endpoint, **download_kwargs
+        )
+        upload_response = ayon_api.get(endpoint, **upload_kwargs)
+        responses = [upload_response, download_future.result()]
+
+        for response in responses:
+            if response.status_code not in _SUCCESS_STATUS_CODES:
+                raise RuntimeError(
+                    "Cannot get representations for sync with code {}".format(
+                        response.status_code
+                    )
                 )
-            )
-
-        repre_states = response.data["representations"]
 
-        # get to download
+        upload_response, download_response = responses
+        repre_states = upload_response.data["representations"]
         if len(repre_states) < limit:
-            kwargs["localStatusFilter"] = [
-                SiteSyncStatus.QUEUED, SiteSyncStatus.FAILED
-            ]
-            kwargs["remoteStatusFilter"] = [SiteSyncStatus.OK]
-
-            response = ayon_api.get(endpoint, **kwargs)
-            repre_states.extend(response.data["representations"])
+            repre_states.extend(download_response.data["representations"])
 
         return repre_states
 
-    def check_status(self, file_state, local_site, remote_site, config_preset):
+    def check_status(
+        self,
+        file_state,
+        local_site,
+        remote_site,
+        config_preset,
+        local_site_id=None
+    ):
         """Check synchronization status of a file.
 
         The file is on representation status is checked for single 'provider'.
@@ -1423,37 +2059,33 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             local_site (str): Local site of compare (usually 'studio').
             remote_site (str): Remote site (gdrive etc).
             config_preset (dict): Config about active site, retries.
+            local_site_id (Optional[str]): Site id of this machine, can be
+                passed by caller checking many files.
 
         Returns:
             int: Sync status value of representation.
 
         """
-        if get_local_site_id() not in (local_site, remote_site):
+        if local_site_id is None:
+            local_site_id = self.local_site_id
+        if local_site_id not in (local_site, remote_site):
             # don't do upload/download for studio sites
             self.log.debug(
                 "No local site {} - {}".format(local_site, remote_site)
             )
             return SyncStatus.DO_NOTHING
 
-        local_status = file_state["localStatus"]["status"]
-        remote_status = file_state["remoteStatus"]["status"]
-
-        if (
-            local_status != SiteSyncStatus.OK
-            and remote_status == SiteSyncStatus.OK
-        ):
-            retries = file_state["localStatus"]["retries"]
-            if retries < int(config_preset["retry_cnt"]):
-                return SyncStatus.DO_DOWNLOAD
-
-        if (
-            remote_status != SiteSyncStatus.OK
-            and local_status == SiteSyncStatus.OK
-        ):
-            retries = file_state["remoteStatus"]["retries"]
-            if retries < int(config_preset["retry_cnt"]):
-                return SyncStatus.DO_UPLOAD
+        sync_action = _SYNC_ACTION_BY_STATE.get((
+            file_state["localStatus"]["status"] == SiteSyncStatus.OK,
+            file_state["remoteStatus"]["status"] == SiteSyncStatus.OK,
+        ))
+        if sync_action is None:
+            return SyncStatus.DO_NOTHING
 
+        sync_status, status_key = sync_action
+        retries = file_state[status_key]["retries"]
+        if retries < int(config_preset["retry_cnt"]):
+            return sync_status
         return SyncStatus.DO_NOTHING
 
     def update_db(
@@ -1488,55 +2120,180 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         Returns:
             None
         """
-        files_status = []
-        for file_status in repre_status["files"]:
-            status_entity = copy.deepcopy(
-                file_status["{}Status".format(side)]
-            )
-            status_entity["fileHash"] = file_status["fileHash"]
-            status_entity["id"] = file_status["id"]
-            if file_status["fileHash"] == file["fileHash"]:
-                if new_file_id:
-                    status_entity["status"] = SiteSyncStatus.OK
-                    status_entity.pop("message")
-                    status_entity.pop("retries")
-                elif progress is not None:
-                    status_entity["status"] = SiteSyncStatus.IN_PROGRESS
-                    status_entity["progress"] = progress
-                elif error:
-                    status_entity["status"] = SiteSyncStatus.FAILED
-                    tries = status_entity.get("retries", 0)
-                    tries += 1
-                    status_entity["retries"] = tries
-                    status_entity["message"] = error
-                elif pause is not None:
-                    if pause:
-                        status_entity["pause"] = True
-                    else:
-                        status_entity.remove("pause")
-                files_status.append(status_entity)
+        state_update = self.get_state_update(
+            repre_status,
+            site_name,
+            new_file_id=new_file_id,
+            file=file,
+            side=side,
+            error=error,
+            progress=progress,
+            priority=priority,
+            pause=pause
+        )
+        # progress is updated often, updates sent in short interval are
+        #   batched to one request
+        if progress is not None:
+            self._queue_state_update(project_name, state_update)
+            return
 
-        representation_id = repre_status["representationId"]
+        self.update_db_bulk(project_name, [state_update])
+        if priority is not None or pause is not None:
+            return
 
-        endpoint = "{}/{}/state/{}/{}".format(
-            self.endpoint_prefix,
-            project_name,
-            representation_id,
-            site_name)
+        self.log_file_processed(
+            repre_status["representationId"], file, new_file_id, error
+        )
 
-        # get to upload
-        kwargs = {
+    def get_state_update(
+        self,
+        repre_status,
+        site_name,
+        new_file_id=None,
+        file=None,
+        side=None,
+        error=None,
+        progress=None,
+        priority=None,
+        pause=None
+    ):
+        """Prepare state update of representation on site.
+
+        Output can be sent to server with 'update_db_bulk'. Arguments have
+        same meaning as in 'update_db'. Status of all files of
+        representation is changed when 'file' is not passed.
+
+        Returns:
+            dict[str, Any]: State update of representation on site.
+
+        """
+        files_status = []
+        status_key = "{}Status".format(side)
+        file_hash = file["fileHash"] if file else None
+        for file_status in repre_status["files"]:
+            # only status of processed file is changed and sent, more files
+            #   might have same hash so loop does not stop on first match
+            if file_hash is not None and file_status["fileHash"] != file_hash:
+                continue
+            # status values are flat, shallow copy is enough, 'fileHash' is
+            #   required by server
+            status_entity = {
+                **file_status[status_key],
+                "fileHash": file_status["fileHash"],
+                "id": file_status["id"],
+            }
+            if new_file_id:
+                status_entity["status"] = SiteSyncStatus.OK
+                status_entity.pop("message", None)
+                status_entity.pop("retries", None)
+            elif progress is not None:
+                status_entity["status"] = SiteSyncStatus.IN_PROGRESS
+                status_entity["progress"] = progress
+            elif error:
+                status_entity["status"] = SiteSyncStatus.FAILED
+                tries = status_entity.get("retries", 0)
+                tries += 1
+                status_entity["retries"] = tries
+                status_entity["message"] = error
+            elif pause is not None:
+                if pause:
+                    status_entity["pause"] = True
+                else:
+                    status_entity.pop("pause", None)
+            files_status.append(status_entity)
+
+        state_update = {
+            "representationId": repre_status["representationId"],
+            "siteName": site_name,
             "files": files_status
         }
-
         if priority:
-            kwargs["priority"] = priority
+            state_update["priority"] = priority
+        return state_update
+
+    def update_db_bulk(self, project_name, state_updates):
+        """Send multiple representation state updates in one request.
+
+        Queued updates of the project are sent first so the order of updates
+        is kept. Queued updates are queued again when request fails.
+
+        Args:
+            project_name (str): Project name.
+            state_updates (list[dict[str, Any]]): Updates created by
+                'get_state_update'.
+
+        """
+        with self._state_updates_lock:
+            queued_updates = self._state_updates.pop(project_name, [])
+            self._state_updates_sent[project_name] = time.monotonic()
+        state_updates = queued_updates + list(state_updates)
+        if not state_updates:
+            return
+
+        endpoint = self._get_state_endpoint(project_name)
+        try:
+            response = self._post_sync_state(
+                endpoint, {"items": state_updates}
+            )
+            success = response.status_code in _SUCCESS_STATUS_CODES
+        except Exception:
+            self._requeue_state_updates(project_name, queued_updates)
+            raise
 
-        response = ayon_api.post(endpoint, **kwargs)
-        if response.status_code not in [200, 204]:
+        if not success:
+            self._requeue_state_updates(project_name, queued_updates)
             raise RuntimeError("Cannot update status")
 
-        if progress is not None or priority is not None:
+        # server skips updates it cannot store, e.g. of deleted
+        #   representations, other updates are stored
+        failed_ids = (response.data or {}).get("failedRepresentationIds")
+        if failed_ids:
+            self.log.warning(
+                "Cannot update status of representations {}".format(
+                    ", ".join(failed_ids)
+                )
+            )
+
+    def flush_state_updates(self):
+        """Send all queued representation state updates to server."""
+        with self._state_updates_lock:
+            project_names = list(self._state_updates.keys())
+        for project_name in project_names:
+            self.update_db_bulk(project_name, [])
+
+    def _requeue_state_updates(self, project_name, state_updates):
+        if not state_updates:
+            return
+        with self._state_updates_lock:
+            # updates queued meanwhile are newer, keep them last
+            queued_updates = self._state_updates[project_name]
+            queued_updates[:0] = state_updates
+
+    def _queue_state_update(self, project_name, state_update):
+        with self._state_updates_lock:
+            queued_updates = self._state_updates[project_name]
+            queued_updates.append(state_update)
+            last_sent = self._state_updates_sent.get(project_name, 0)
+            send = (
+                len(queued_updates) >= self.STATE_UPDATES_BATCH_SIZE
+                or time.monotonic() - last_sent
+                >= self.STATE_UPDATES_FLUSH_SEC
+            )
+        if send:
+            self.update_db_bulk(project_name, [])
+
+    def log_file_processed(self, representation_id, file, new_file_id, error):
+        """Log result of file synchronization.
+
+        Args:
+            representation_id (str): Representation id.
+            file (dict[str, Any]): Info about processed file.
+            new_file_id (Union[str, None]): File id if process succeeded.
+            error (Union[str, None]): Error message if process failed.
+
+        """
+        # called for each processed file, skip formatting if not logged
+        if not self.log.isEnabledFor(logging.DEBUG):
             return
 
         status = "failed"
@@ -1615,20 +2372,98 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             project_name, representation_id, site_name, file_id, force=True
         )
 
+    def reset_sites_on_representations(
+        self,
+        project_name,
+        representation_ids,
+        side=None,
+        site_name=None
+    ):
+        """Reset synchronization of multiple representations at once.
+
+        Bulk variant of 'reset_site_on_representation'. Representations
+        are queried and their states sent with one request each.
+
+        Args:
+            project_name (str): Project name.
+            representation_ids (Iterable[str]): Representation ids.
+            side (str): Local or remote side.
+            site_name (str): for adding new site
+
+        Raises:
+            ValueError: Misconfiguration or representation not found.
+
+        """
+        if side and site_name:
+            raise ValueError(
+                "Misconfiguration, only one of side and"
+                " site_name arguments should be passed."
+            )
+
+        if not self.get_sync_project_setting(project_name):
+            raise ValueError("Project not configured")
+
+        if side:
+            if side == "local":
+                site_name = self.get_active_site(project_name)
+            else:
+                site_name = self.get_remote_site(project_name)
+
+        if not site_name:
+            site_name = self.DEFAULT_SITE
+
+        representation_ids = {
+            _canonical_repre_id(representation_id)
+            for representation_id in representation_ids
+        }
+        if not representation_ids:
+            return
+
+        representations = list(get_representations(
+            project_name,
+            representation_ids=representation_ids,
+            fields={"id", "files"}
+        ))
+        missing_ids = representation_ids - {
+            _canonical_repre_id(repre["id"])
+            for repre in representations
+        }
+        if missing_ids:
+            raise ValueError(
+                "Representations {} not found in {}".format(
+                    ", ".join(sorted(missing_ids)), project_name
+                )
+            )
+
+        timestamp = time.time()
+        state_updates = [
+            {
+                "representationId": repre["id"],
+                "siteName": site_name,
+                "files": self._get_files_site_state(
+                    repre["files"], SiteSyncStatus.QUEUED, timestamp
+                ),
+            }
+            for repre in representations
+            if repre.get("files")
+        ]
+        self.update_db_bulk(project_name, state_updates)
+
     def _get_progress_for_repre_new(
         self,
         project_name,
         representation,
         local_site_name,
-        remote_site_name=None
+        remote_site_name=None,
+        sync_status=None
     ):
-        representation_id = representation["id"]
-        sync_status = self.get_repre_sync_state(
-            project_name,
-            representation_id,
-            local_site_name,
-            remote_site_name
-        )
+        if sync_status is None:
+            sync_status = self.get_repre_sync_state(
+                project_name,
+                representation["id"],
+                local_site_name,
+                remote_site_name
+            )
 
         progress = {
             local_site_name: -1,
@@ -1637,35 +2472,27 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         if not sync_status:
             return progress
 
-        mapping = {
-            "localStatus": local_site_name,
-            "remoteStatus": remote_site_name
-        }
-        files = {local_site_name: 0, remote_site_name: 0}
         file_states = sync_status.get("files") or []
-        for file_state in file_states:
-            for status in mapping.keys():
-                status_info = file_state[status]
-                site_name = mapping[status]
-                files[site_name] += 1
-                norm_progress = max(progress[site_name], 0)
-                if status_info["status"] == SiteSyncStatus.OK:
-                    progress[site_name] = norm_progress + 1
-                elif status_info.get("progress"):
-                    progress[site_name] = norm_progress + status_info[
-                        "progress"]
-                else:  # site exists, might be failed, do not add again
-                    progress[site_name] = 0
+        if not file_states:
+            return progress
 
         # for example 13 fully avail. files out of 26 >> 13/26 = 0.5
-        return {
-            local_site_name: (
-                progress[local_site_name] / max(files[local_site_name], 1)
-            ),
-            remote_site_name: (
-                progress[remote_site_name] / max(files[remote_site_name], 1)
+        files_count = len(file_states)
+        status_ok = SiteSyncStatus.OK
+        for status_key, site_name in (
+            ("localStatus", local_site_name),
+            ("remoteStatus", remote_site_name),
+        ):
+            # failed or queued files do not add anything
+            site_progress = sum(
+                1 if status_info["status"] == status_ok
+                else status_info.get("progress") or 0
+                for status_info in (
+                    file_state[status_key] for file_state in file_states
+                )
             )
-        }
+            progress[site_name] = site_progress / files_count
+        return progress
 
     def _get_progress_for_repre_old(
         self,
@@ -1715,21 +2542,105 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
 
         return self._get_progress_for_repre_new(*args, **kwargs)
 
+    def get_progress_for_repres(
+        self,
+        project_name,
+        representations,
+        local_site_name,
+        remote_site_name=None
+    ):
+        """Calculates average progress for multiple representations.
+
+        Same as 'get_progress_for_repre' but sync states of all
+        representations are fetched with single request.
+
+        Args:
+            project_name (str): Project name.
+            representations (Iterable[dict[str, Any]]): Representation
+                entities.
+            local_site_name (str): Local site name.
+            remote_site_name (Optional[str]): Remote site name.
+
+        Returns:
+            dict[str, dict[str, float]]: Progress of sites by
+                representation id.
+
+        """
+        representations = list(representations)
+        sync_states = self.get_repre_sync_states(
+            project_name,
+            {repre["id"] for repre in representations},
+            local_site_name,
+            remote_site_name
+        )
+        # empty dict makes progress of missing states '-1' without request
+        return {
+            repre["id"]: self._get_progress_for_repre_new(
+                project_name,
+                repre,
+                local_site_name,
+                remote_site_name,
+                sync_status=sync_states.get(repre["id"], {})
+            )
+            for repre in representations
+        }
+
     def _set_state_sync_state(
         self, project_name, representation_id, site_name, payload_dict
     ):
         """Calls server endpoint to store sync info for 'representation_id'."""
-        endpoint = "{}/{}/state/{}/{}".format(
-            self.endpoint_prefix,
-            project_name,
-            representation_id,
-            site_name
+        endpoint = self._get_state_endpoint(
+            project_name, representation_id, site_name
         )
 
-        response = ayon_api.post(endpoint, **payload_dict)
-        if response.status_code not in [200, 204]:
+        response = self._post_sync_state(endpoint, payload_dict)
+        if response.status_code not in _SUCCESS_STATUS_CODES:
             raise RuntimeError("Cannot update status")
 
+    def ensure_server_session(self):
+        """Make server connection reuse one http session.
+
+        Without session each request to server opens new connection, which
+        is expensive for many small requests of the sync loop. Existing
+        session is kept.
+        """
+        try:
+            con = ayon_api.get_server_api_connection()
+            con.create_session(ignore_existing=True)
+        except Exception:
+            self.log.warning(
+                "Couldn't create server session, requests won't reuse"
+                " connections",
+                exc_info=True
+            )
+
+    def _post_sync_state(self, endpoint, payload_dict):
+        """Post sync state payload to server endpoint.
+
+        Payload is serialized with 'orjson' when available, which is
+        considerably faster for file lists of large representations.
+
+        Args:
+            endpoint (str): Server endpoint.
+            payload_dict (dict[str, Any]): Data to be sent as json body.
+
+        Returns:
+            RestApiResponse: Server response.
+
+        """
+        if orjson is None:
+            return ayon_api.post(endpoint, **payload_dict)
+
+        con = ayon_api.get_server_api_connection()
+        headers = con.get_headers()
+        # body is sent as raw bytes, content type must be set explicitly
+        headers["Content-Type"] = "application/json"
+        return con.raw_post(
+            endpoint,
+            data=orjson.dumps(payload_dict),
+            headers=headers
+        )
+
     def get_repre_sync_state(
         self,
         project_name,
@@ -1764,6 +2675,50 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             if repre_state["localStatus"]["status"] != -1:
                 return repre_state
 
+    def get_repre_sync_states(
+        self,
+        project_name,
+        representation_ids,
+        local_site_name,
+        remote_site_name=None,
+        **kwargs
+    ):
+        """Synchronization info for multiple representations in one request.
+
+        Bulk variant of 'get_repre_sync_state'.
+
+        Args:
+            project_name (str): Project name.
+            representation_ids (Iterable[str]): Representation ids.
+            local_site_name (str)
+            remote_site_name (str)
+            all other parameters for `Get Site Sync State` endpoint if
+                necessary
+
+        Returns:
+            dict[str, dict[str, Any]]: Sync state by representation id,
+                representations without state on local site are skipped.
+
+        """
+        representation_ids = list(representation_ids)
+        if not representation_ids:
+            return {}
+
+        # server returns only first page (50 items) by default
+        kwargs.setdefault("pageLength", len(representation_ids))
+        repre_states = self._get_repres_state(
+            project_name,
+            representation_ids,
+            local_site_name,
+            remote_site_name,
+            **kwargs
+        )
+        return {
+            repre_state["representationId"]: repre_state
+            for repre_state in repre_states
+            if repre_state["localStatus"]["status"] != -1
+        }
+
     def get_representations_sync_state(
         self,
         project_name,
@@ -1858,9 +2813,7 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         if kwargs:
             payload_dict.update(kwargs)
 
-        endpoint = "{}/{}/state".format(
-            self.endpoint_prefix, project_name
-        )
+        endpoint = self._get_state_endpoint(project_name)
 
         response = ayon_api.get(endpoint, **payload_dict)
         if response.status_code != 200:
@@ -1903,9 +2856,7 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         }
         payload_dict.update(kwargs)
 
-        endpoint = "{}/{}/state".format(
-            self.endpoint_prefix, project_name
-        )
+        endpoint = self._get_state_endpoint(project_name)
 
         response = ayon_api.get(endpoint, **payload_dict)
         if response.status_code != 200:
@@ -1951,7 +2902,7 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             site_name (str): name of configured and active site
 
         """
-        my_local_site = get_local_site_id()
+        my_local_site = self.local_site_id
         if my_local_site != site_name:
             self.log.warning(
                 "Cannot remove non local file for {}".format(site_name)
@@ -1974,6 +2925,24 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             )
             return
 
+        self._remove_representation_local_files(
+            project_name, representation, site_name
+        )
+
+    def _remove_representation_local_files(
+        self, project_name, representation, site_name
+    ):
+        """Removes local files of representation entity on 'site_name'.
+
+        Args:
+            project_name (str): Project name.
+            representation (dict[str, Any]): Representation entity with
+                'id' and 'files'.
+            site_name (str): name of configured and active site
+
+        """
+        representation_id = representation["id"]
+        local_file_paths = {}
         for file in representation["files"]:
             local_file_path = self.get_local_file_path(
                 project_name,
@@ -1982,20 +2951,44 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
             )
             if local_file_path is None:
                 raise ValueError("Missing local file path")
+            local_file_paths[local_file_path] = file
 
+        if not local_file_paths:
+            self.log.debug("No file set for {}".format(representation_id))
+            return
+
+        def _remove_file(local_file_path):
+            self.log.debug("Removing {}".format(local_file_path))
             try:
-                self.log.debug("Removing {}".format(local_file_path))
                 os.remove(local_file_path)
-            except IndexError:
-                msg = "No file set for {}".format(representation_id)
-                self.log.debug(msg)
-                raise ValueError(msg)
             except OSError:
-                msg = "File {} cannot be removed".format(file["path"])
-                self.log.warning(msg)
-                raise ValueError(msg)
+                return local_file_path
+            return None
+
+        # sequences may have thousands of files, removal on network
+        #   storage is mostly waiting
+        max_workers = min(self.REMOVE_FILES_WORKERS, len(local_file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            failed_paths = [
+                local_file_path
+                for local_file_path in executor.map(
+                    _remove_file, local_file_paths
+                )
+                if local_file_path is not None
+            ]
 
-            folder = os.path.dirname(local_file_path)
+        if failed_paths:
+            msg = "File {} cannot be removed".format(
+                local_file_paths[failed_paths[0]]["path"]
+            )
+            self.log.warning(msg)
+            raise ValueError(msg)
+
+        folders = {
+            os.path.dirname(local_file_path)
+            for local_file_path in local_file_paths
+        }
+        for folder in folders:
             if os.listdir(folder):  # folder is not empty
                 continue
 
@@ -2067,11 +3060,13 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         """
 
         os.environ["AYON_SITE_ID"] = active_site
+        self.invalidate_local_site_id()
+
+        stop_event = threading.Event()
 
         def signal_handler(sig, frame):
             print("You pressed Ctrl+C. Process ended.")
-            self.server_exit()
-            sys.exit(0)
+            stop_event.set()
 
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
@@ -2079,5 +3074,14 @@ class SiteSyncAddon(AYONAddon, ITrayAddon, IPluginPaths):
         self.server_init()
         self.server_start()
 
-        while True:
-            time.sleep(1.0)
+        # sleep until signal arrives, waiting on event is not interrupted
+        #   by Ctrl+C on Windows so timeout is used there
+        if hasattr(signal, "pause"):
+            while not stop_event.is_set():
+                signal.pause()
+        else:
+            while not stop_event.wait(1.0):
+                pass
+
+        self.server_exit()
+        sys.exit(0)
@@ -3,11 +3,11 @@ import os
 import asyncio
 import threading
 import concurrent.futures
+import collections
 import time
 
 from typing import Union
 
-from ayon_core.lib import get_local_site_id
 from ayon_core.addon import AddonsManager
 from ayon_core.lib import Logger
 from ayon_core.pipeline import Anatomy
@@ -286,7 +286,7 @@ def download_last_published_workfile(
         return None
 
     # Get local site
-    local_site_id = get_local_site_id()
+    local_site_id = sitesync_addon.local_site_id
 
     # Add workfile representation to local site
     representation_ids = {workfile_representation["id"]}
@@ -339,6 +339,7 @@ class SiteSyncThread(threading.Thread):
 
         try:
             self.log.info("Starting SiteSync")
+            self.addon.ensure_server_session()
             self.loop = asyncio.new_event_loop()  # create new loop for thread
             asyncio.set_event_loop(self.loop)
             self.loop.set_default_executor(self.executor)
@@ -376,6 +377,8 @@ class SiteSyncThread(threading.Thread):
                 enabled_projects = self.addon.get_enabled_projects()
                 for project_name in enabled_projects:
                     await self._sync_project(project_name)
+                # progress updates not sent with other updates
+                self.addon.flush_state_updates()
 
                 duration = time.time() - start_time
                 self.log.debug("One loop took {:.2f}s".format(duration))
@@ -413,12 +416,11 @@ class SiteSyncThread(threading.Thread):
             periodically.
         """
         while self.is_running:
-            if self.addon.long_running_tasks:
-                task = self.addon.long_running_tasks.pop()
+            task = self.addon.long_running_tasks.get()
+            if task is not None:
                 self.log.info("starting long running")
                 await self.loop.run_in_executor(None, task["func"])
                 self.log.info("finished long running")
-                self.addon.projects_processed.remove(task["project_name"])
             await asyncio.sleep(0.5)
 
         tasks = [
@@ -525,6 +527,10 @@ class SiteSyncThread(threading.Thread):
         # reuse same id
         processed_file_path = set()
 
+        # same for all files
+        config_preset = preset.get("config")
+        local_site_id = self.addon.local_site_id
+
         # first call to get_provider could be expensive, its
         # building folder tree structure in memory
         # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
@@ -546,7 +552,8 @@ class SiteSyncThread(threading.Thread):
                     file_state,
                     local_site,
                     remote_site,
-                    preset.get("config")
+                    config_preset,
+                    local_site_id
                 )
                 if status == SyncStatus.DO_UPLOAD:
                     tree = handler.get_tree()
@@ -606,6 +613,9 @@ class SiteSyncThread(threading.Thread):
             return_exceptions=True
         )
 
+        # send state updates of all processed files in one request
+        processed_results = []
+        state_updates_by_project = collections.defaultdict(list)
         for file_result, info in zip(files_created, files_processed_info):
             file_state, repre_status, site_name, side, project_name = info
             error = None
@@ -614,17 +624,29 @@ class SiteSyncThread(threading.Thread):
                 self.log.warning(error, exc_info=True)
                 file_result = None  # it is exception >> no id >> reset
 
-            self.addon.update_db(
-                project_name=project_name,
-                new_file_id=file_result,
-                file=file_state,
-                repre_status=repre_status,
-                site_name=site_name,
-                side=side,
-                error=error
+            state_updates_by_project[project_name].append(
+                self.addon.get_state_update(
+                    repre_status,
+                    site_name,
+                    new_file_id=file_result,
+                    file=file_state,
+                    side=side,
+                    error=error
+                )
             )
+            processed_results.append((file_result, error, info))
+
+        for project_name, state_updates in (
+            state_updates_by_project.items()
+        ):
+            self.addon.update_db_bulk(project_name, state_updates)
 
+        for file_result, error, info in processed_results:
+            file_state, repre_status, site_name, side, project_name = info
             repre_id = repre_status["representationId"]
+            self.addon.log_file_processed(
+                repre_id, file_state, file_result, error
+            )
             self.addon.handle_alternate_site(
                 project_name,
                 repre_id,
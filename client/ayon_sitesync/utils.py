@@ -1,4 +1,7 @@
 import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from ayon_core.lib import Logger
 from ayon_api import get_representations, get_versions_links
@@ -6,6 +9,17 @@ from ayon_api import get_representations, get_versions_links
 
 log = Logger.get_logger("SiteSync")
 
+# version ids sent in one links request
+LINKS_BATCH_SIZE = 500
+LINKS_MAX_WORKERS = 4
+# how long are found linked representations valid (in sec)
+LINKED_REPRESENTATIONS_CACHE_TTL = 30
+LINKED_REPRESENTATIONS_CACHE_SIZE = 4096
+
+# linked representation ids with time of query by query arguments
+_linked_representations_cache = {}
+_linked_representations_lock = threading.Lock()
+
 
 class ResumableError(Exception):
     """Error which could be temporary, skip current loop, try next time"""
@@ -52,6 +66,64 @@ def time_function(method):
     return timed
 
 
+class ProjectTaskQueue:
+    """Queue of long running tasks sharded by project name.
+
+    Each shard has its own lock so producers working on unrelated projects
+    do not block each other. Consumer takes tasks from shards round-robin
+    and skips shards which are currently locked.
+
+    Args:
+        shards_count (int): Number of shards.
+
+    """
+    def __init__(self, shards_count=8):
+        self._shards = [deque() for _ in range(shards_count)]
+        self._locks = [threading.Lock() for _ in range(shards_count)]
+        self._next_shard = 0
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+    def _get_shard_index(self, project_name):
+        return hash(project_name) % len(self._shards)
+
+    def put(self, project_name, task):
+        """Add task for project to the queue.
+
+        Args:
+            project_name (str): Project name.
+            task (dict[str, Any]): Task data with 'func' to be called.
+
+        """
+        index = self._get_shard_index(project_name)
+        with self._locks[index]:
+            self._shards[index].append(task)
+
+    def get(self):
+        """Pop oldest task from next non-empty shard.
+
+        Returns:
+            Union[dict[str, Any], None]: Task data or None if there is no
+                task available right now.
+
+        """
+        shards_count = len(self._shards)
+        for offset in range(shards_count):
+            index = (self._next_shard + offset) % shards_count
+            lock = self._locks[index]
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                shard = self._shards[index]
+                if shard:
+                    self._next_shard = (index + 1) % shards_count
+                    return shard.popleft()
+            finally:
+                lock.release()
+        return None
+
+
 class EditableScopes:
     SYSTEM = 0
     PROJECT = 1
@@ -93,36 +165,73 @@ def get_linked_representation_id(
     if max_depth is None or max_depth == 0:
         max_depth = 1
 
+    # same links are often requested multiple times during one sync loop
+    key = (project_name, version_id, link_type, max_depth)
+    with _linked_representations_lock:
+        cached = _linked_representations_cache.get(key)
+    if (
+        cached is not None
+        and time.time() - cached[0] <= LINKED_REPRESENTATIONS_CACHE_TTL
+    ):
+        return list(cached[1])
+
+    representation_ids = _get_linked_representation_ids(
+        project_name, version_id, link_type, max_depth
+    )
+    with _linked_representations_lock:
+        if (
+            len(_linked_representations_cache)
+            >= LINKED_REPRESENTATIONS_CACHE_SIZE
+        ):
+            # drop oldest item
+            _linked_representations_cache.pop(
+                next(iter(_linked_representations_cache))
+            )
+        _linked_representations_cache.pop(key, None)
+        _linked_representations_cache[key] = (
+            time.time(), representation_ids
+        )
+    return list(representation_ids)
+
+
+def clear_linked_representations_cache():
+    """Remove cached results of 'get_linked_representation_id'."""
+    with _linked_representations_lock:
+        _linked_representations_cache.clear()
+
+
+def _get_linked_representation_ids(
+    project_name, version_id, link_type, max_depth
+):
+    """Query representation ids linked to version, without cache."""
     link_types = None
     if link_type:
         link_types = [link_type]
 
-    # Store already found version ids to avoid recursion, and also to store
-    #   output -> Don't forget to remove 'version_id' at the end!!!
-    linked_version_ids = {version_id}
+    # Versions already checked, to avoid recursion
+    visited_version_ids = {version_id}
+    linked_version_ids = set()
     # Each loop of depth will reset this variable
     versions_to_check = {version_id}
     for _ in range(max_depth):
         if not versions_to_check:
             break
 
-        versions_links = get_versions_links(
-            project_name,
-            versions_to_check,
-            link_types=link_types,
-            link_direction="in")  # looking for 'in'puts for version
-
-        versions_to_check = set()
-        for links in versions_links.values():
-            for link in links:
-                # Care only about version links
-                if link["entityType"] != "version":
-                    continue
-                entity_id = link["entityId"]
-                linked_version_ids.add(entity_id)
-                versions_to_check.add(entity_id)
-
-    linked_version_ids.remove(version_id)
+        versions_links = _get_versions_links_batched(
+            project_name, versions_to_check, link_types
+        )
+
+        # Care only about version links
+        versions_to_check = {
+            link["entityId"]
+            for links in versions_links
+            for link in links
+            if link["entityType"] == "version"
+        }
+        versions_to_check -= visited_version_ids
+        visited_version_ids |= versions_to_check
+        linked_version_ids |= versions_to_check
+
     if not linked_version_ids:
         return []
     representations = get_representations(
@@ -133,3 +242,42 @@ def get_linked_representation_id(
         repre["id"]
         for repre in representations
     ]
+
+
+def _get_versions_links_batched(project_name, version_ids, link_types):
+    """Input links of versions, big amount of versions is split to batches.
+
+    Batches are requested concurrently, so whole depth level of links
+    takes about one request time.
+
+    Returns:
+        list[list[dict[str, Any]]]: Links of each version.
+
+    """
+    version_ids = list(version_ids)
+    batches = [
+        version_ids[idx:idx + LINKS_BATCH_SIZE]
+        for idx in range(0, len(version_ids), LINKS_BATCH_SIZE)
+    ]
+
+    def _get_links(batch):
+        # looking for 'in'puts for version
+        return get_versions_links(
+            project_name,
+            batch,
+            link_types=link_types,
+            link_direction="in"
+        )
+
+    if len(batches) == 1:
+        results = [_get_links(batches[0])]
+    else:
+        max_workers = min(LINKS_MAX_WORKERS, len(batches))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_get_links, batches))
+
+    return [
+        links
+        for versions_links in results
+        for links in versions_links.values()
+    ]
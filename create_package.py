@@ -30,10 +30,13 @@ import shutil
 import platform
 import argparse
 import logging
-import collections
+import functools
 import zipfile
 import subprocess
-from typing import Optional, Iterable, Pattern, Union, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Optional, Iterable, Pattern, Union, List, Set, Tuple, Callable
+)
 
 import package
 
@@ -50,6 +53,27 @@ DST_DIST_DIR: str = os.path.join("frontend", "dist")
 PRIVATE_ROOT: str = os.path.join(CURRENT_ROOT, "private")
 PUBLIC_ROOT: str = os.path.join(CURRENT_ROOT, "public")
 CLIENT_ROOT: str = os.path.join(CURRENT_ROOT, "client")
+# Threads scanning directories of source tree
+SCAN_WORKERS: int = 8
+# Files in these formats are already compressed, deflate would not make
+#   them smaller
+STORED_EXTENSIONS: Tuple[str, ...] = (
+    ".br",
+    ".gif",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".png",
+    ".webp",
+    ".woff",
+    ".woff2",
+    ".zip",
+)
+# Deflate level of zip files, lower level is much faster with almost the
+#   same size for source code
+ZIP_COMPRESS_LEVEL: int = 3
+# Buffer of package zip output file, coalesces small writes of members
+ZIP_WRITE_BUFFER_SIZE: int = 1024 * 1024
 
 VERSION_PY_CONTENT = f'''# -*- coding: utf-8 -*-
 """Package declaring AYON addon '{ADDON_NAME}' version."""
@@ -59,27 +83,73 @@ __version__ = "{ADDON_VERSION}"
 # Patterns of directories to be skipped for server part of addon
 IGNORE_DIR_PATTERNS: List[Pattern] = [
     re.compile(pattern)
-    for pattern in {
+    for pattern in (
         # Skip directories starting with '.'
         r"^\.",
         # Skip any pycache folders
         "^__pycache__$"
-    }
+    )
 ]
 
 # Patterns of files to be skipped for server part of addon
 IGNORE_FILE_PATTERNS: List[Pattern] = [
     re.compile(pattern)
-    for pattern in {
+    for pattern in (
         # Skip files starting with '.'
         # NOTE this could be an issue in some cases
         r"^\.",
         # Skip '.pyc' files
         r"\.pyc$"
-    }
+    )
 ]
 
 
+def _union_regexes(regexes: Iterable[Pattern]) -> Pattern:
+    """Compile patterns into single regex matching any of them.
+
+    Never matching regex is returned if no pattern is passed. Result is
+    cached, the same patterns are compiled only once.
+    """
+    return _compile_union(tuple(
+        (regex.pattern, regex.flags)
+        for regex in regexes
+    ))
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_union(patterns: Tuple[Tuple[str, int], ...]) -> Pattern:
+    if not patterns:
+        return re.compile(r"(?!)")
+    # keep flags of each pattern, e.g. IGNORECASE, scoped to its group
+    parts = []
+    for pattern, flags in patterns:
+        inline_flags = "".join(
+            char
+            for flag, char in (
+                (re.IGNORECASE, "i"),
+                (re.MULTILINE, "m"),
+                (re.DOTALL, "s"),
+                (re.VERBOSE, "x"),
+            )
+            if flags & flag
+        )
+        if inline_flags:
+            parts.append(f"(?{inline_flags}:{pattern})")
+        else:
+            parts.append(f"(?:{pattern})")
+    return re.compile("|".join(parts))
+
+
+def _is_ignored_dir_name(name: str) -> bool:
+    """Same as 'IGNORE_DIR_PATTERNS' without regex engine."""
+    return name.startswith(".") or name == "__pycache__"
+
+
+def _is_ignored_file_name(name: str) -> bool:
+    """Same as 'IGNORE_FILE_PATTERNS' without regex engine."""
+    return name.startswith(".") or name.endswith(".pyc")
+
+
 class ZipFileLongPaths(zipfile.ZipFile):
     """Allows longer paths in zip files.
 
@@ -101,25 +171,18 @@ class ZipFileLongPaths(zipfile.ZipFile):
         return super()._extract_member(member, tpath, pwd)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_yarn_executable() -> Union[str, None]:
-    cmd = "which"
-    if platform.system().lower() == "windows":
-        cmd = "where"
-
-    for line in subprocess.check_output(
-        [cmd, "yarn"], encoding="utf-8"
-    ).splitlines():
-        if not line or not os.path.exists(line):
-            continue
-        try:
-            subprocess.call([line, "--version"])
-            return line
-        except OSError:
-            continue
-    return None
+    # 'shutil.which' looks into PATH (and PATHEXT on windows) without
+    #   spawning any process
+    return shutil.which("yarn")
 
 
-def safe_copy_file(src_path: str, dst_path: str):
+def safe_copy_file(
+    src_path: str,
+    dst_path: str,
+    created_dirs: Optional[Set[str]] = None
+):
     """Copy file and make sure destination directory exists.
 
     Ignore if destination already contains directories from source.
@@ -127,22 +190,26 @@ def safe_copy_file(src_path: str, dst_path: str):
     Args:
         src_path (str): File path that will be copied.
         dst_path (str): Path to destination file.
+        created_dirs (Optional[set[str]]): Directories that already exist.
+            Directory of destination is added to it when created, so
+            copying of multiple files does not check the same directory
+            again.
     """
 
     if src_path == dst_path:
         return
 
-    dst_dir: str = os.path.dirname(dst_path)
-    os.makedirs(dst_dir, exist_ok=True)
+    _ensure_dir(os.path.dirname(dst_path), created_dirs)
 
     shutil.copy2(src_path, dst_path)
 
 
-def _value_match_regexes(value: str, regexes: Iterable[Pattern]) -> bool:
-    return any(
-        regex.search(value)
-        for regex in regexes
-    )
+def _ensure_dir(dirpath: str, created_dirs: Optional[Set[str]] = None):
+    if created_dirs is None:
+        os.makedirs(dirpath, exist_ok=True)
+    elif dirpath not in created_dirs:
+        os.makedirs(dirpath, exist_ok=True)
+        created_dirs.add(dirpath)
 
 
 def find_files_in_subdir(
@@ -168,37 +235,79 @@ def find_files_in_subdir(
             directories relative to 'src_path'.
     """
 
+    # default patterns are simple, plain string checks are used instead
     if ignore_file_patterns is None:
-        ignore_file_patterns = IGNORE_FILE_PATTERNS
+        is_file_ignored: Callable[[str], object] = _is_ignored_file_name
+    else:
+        is_file_ignored = _union_regexes(ignore_file_patterns).search
 
     if ignore_dir_patterns is None:
-        ignore_dir_patterns = IGNORE_DIR_PATTERNS
+        is_dir_ignored: Callable[[str], object] = _is_ignored_dir_name
+    else:
+        is_dir_ignored = _union_regexes(ignore_dir_patterns).search
     output: List[Tuple[str, str]] = []
     if not os.path.exists(src_path):
         return output
 
-    hierarchy_queue: collections.deque = collections.deque()
-    hierarchy_queue.append((src_path, []))
-    while hierarchy_queue:
-        item: Tuple[str, str] = hierarchy_queue.popleft()
-        dirpath, parents = item
-        for name in os.listdir(dirpath):
-            path: str = os.path.join(dirpath, name)
-            if os.path.isfile(path):
-                if not _value_match_regexes(name, ignore_file_patterns):
-                    items: List[str] = list(parents)
-                    items.append(name)
-                    output.append((path, os.path.sep.join(items)))
-                continue
-
-            if not _value_match_regexes(name, ignore_dir_patterns):
-                items: List[str] = list(parents)
-                items.append(name)
-                hierarchy_queue.append((path, items))
+    # directories of one hierarchy level are scanned concurrently, scanning
+    #   is waiting on filesystem so threads are enough
+    hierarchy_level: List[Tuple[str, str]] = [(src_path, "")]
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        while hierarchy_level:
+            next_level: List[Tuple[str, str]] = []
+            for files, subdirs in executor.map(
+                lambda item: _scan_dir(
+                    item[0], item[1], is_file_ignored, is_dir_ignored
+                ),
+                hierarchy_level
+            ):
+                output.extend(files)
+                next_level.extend(subdirs)
+            hierarchy_level = next_level
 
     return output
 
 
+def _scan_dir(
+    dirpath: str,
+    rel_prefix: str,
+    is_file_ignored: Callable[[str], object],
+    is_dir_ignored: Callable[[str], object]
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """Scan single directory for files and subdirectories.
+
+    Args:
+        dirpath (str): Directory to scan.
+        rel_prefix (str): Relative path of directory ending with path
+            separator, empty string for root directory.
+        is_file_ignored (Callable[[str], object]): Returns truthy value
+            for file names to skip.
+        is_dir_ignored (Callable[[str], object]): Returns truthy value
+            for directory names to skip.
+
+    Returns:
+        tuple[list[tuple[str, str]], list[tuple[str, str]]]: Files
+            with relative path and subdirectories with relative prefix.
+    """
+    files: List[Tuple[str, str]] = []
+    subdirs: List[Tuple[str, str]] = []
+    # scandir entries know their type, no 'stat' call per entry
+    with os.scandir(dirpath) as entries:
+        for entry in entries:
+            name: str = entry.name
+            if entry.is_file():
+                if not is_file_ignored(name):
+                    files.append((entry.path, rel_prefix + name))
+                continue
+
+            if (
+                entry.is_dir()
+                and not is_dir_ignored(name)
+            ):
+                subdirs.append((entry.path, rel_prefix + name + os.sep))
+    return files, subdirs
+
+
 def update_client_version(logger):
     """Update version in client code if version.py is present."""
     if not ADDON_CLIENT_DIR:
@@ -212,8 +321,7 @@ def update_client_version(logger):
         return
 
     logger.info("Updating client version")
-    with open(version_path, "w") as stream:
-        stream.write(VERSION_PY_CONTENT)
+    _write_if_changed(version_path, VERSION_PY_CONTENT)
 
 
 def update_general_version(logger):
@@ -248,8 +356,7 @@ def update_frontend_version(logger):
 
         content = json.dumps(data, indent=2)
         content.rstrip("\n")
-        with open(filepath, "w") as stream:
-            stream.write(content + "\n")
+        _write_if_changed(filepath, content + "\n")
 
     main_file = os.path.join(FRONTEND_ROOT, "src", "main.jsx")
     with open(main_file, "r") as stream:
@@ -267,8 +374,69 @@ def update_frontend_version(logger):
             line = f"{head}{addon_version_spitter} = '{ADDON_VERSION}'\n"
         new_lines.append(line)
 
-    with open(main_file, "w") as stream:
-        stream.write("".join(new_lines))
+    _write_if_changed(main_file, "".join(new_lines))
+
+
+def _write_if_changed(filepath: str, content: str):
+    """Write content to file only if it differs from current content.
+
+    Unchanged files keep their modification time, which is used to decide
+    if frontend has to be rebuilt.
+    """
+    if os.path.exists(filepath):
+        with open(filepath, "r") as stream:
+            if stream.read() == content:
+                return
+    with open(filepath, "w") as stream:
+        stream.write(content)
+
+
+def _get_mtime_range(
+    dirpath: str, skip_dirnames: Set[str]
+) -> Tuple[Optional[float], Optional[float]]:
+    """Oldest and newest modification time of files in directory.
+
+    Args:
+        dirpath (str): Directory to scan recursively.
+        skip_dirnames (set[str]): Names of subdirectories to skip.
+
+    Returns:
+        tuple[Optional[float], Optional[float]]: Oldest and newest
+            modification time, or None if there are no files.
+    """
+    oldest: Optional[float] = None
+    newest: Optional[float] = None
+    dirpaths: List[str] = [dirpath]
+    while dirpaths:
+        with os.scandir(dirpaths.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name not in skip_dirnames:
+                        dirpaths.append(entry.path)
+                    continue
+                mtime: float = entry.stat().st_mtime
+                if oldest is None or mtime < oldest:
+                    oldest = mtime
+                if newest is None or mtime > newest:
+                    newest = mtime
+    return oldest, newest
+
+
+def is_frontend_dist_fresh() -> bool:
+    """Frontend 'dist' was built after last change of frontend sources.
+
+    Returns:
+        bool: Build output is newer than all sources, build can be skipped.
+    """
+    if not os.path.exists(FRONTEND_DIST_ROOT):
+        return False
+    dist_oldest, _ = _get_mtime_range(FRONTEND_DIST_ROOT, set())
+    if dist_oldest is None:
+        return False
+    _, src_newest = _get_mtime_range(
+        FRONTEND_ROOT, {"dist", "node_modules"}
+    )
+    return src_newest is None or src_newest < dist_oldest
 
 
 def build_frontend():
@@ -320,10 +488,20 @@ def get_client_files_mapping() -> List[Tuple[str, str]]:
 def get_client_zip_content(log) -> io.BytesIO:
     log.info("Preparing client code zip")
     files_mapping: List[Tuple[str, str]] = get_client_files_mapping()
+    # version file content is known, no need to read it back from disk
+    version_subpath: str = os.path.join(ADDON_CLIENT_DIR, "version.py")
     stream = io.BytesIO()
-    with ZipFileLongPaths(stream, "w", zipfile.ZIP_DEFLATED) as zipf:
+    with ZipFileLongPaths(
+        stream,
+        "w",
+        zipfile.ZIP_DEFLATED,
+        compresslevel=ZIP_COMPRESS_LEVEL
+    ) as zipf:
         for src_path, subpath in files_mapping:
-            zipf.write(src_path, subpath)
+            if subpath == version_subpath:
+                zipf.writestr(subpath, VERSION_PY_CONTENT)
+            else:
+                zipf.write(src_path, subpath)
     stream.seek(0)
     return stream
 
@@ -381,9 +559,10 @@ def copy_client_code(output_dir: str, log: logging.Logger):
         shutil.rmtree(full_output_path)
     os.makedirs(full_output_path, exist_ok=True)
 
+    created_dirs: Set[str] = {full_output_path}
     for src_path, dst_subpath in get_client_files_mapping():
         dst_path = os.path.join(full_output_path, dst_subpath)
-        safe_copy_file(src_path, dst_path)
+        safe_copy_file(src_path, dst_path, created_dirs)
 
     log.info("Client copy finished")
 
@@ -415,15 +594,15 @@ def copy_addon_package(
     os.makedirs(addon_output_dir, exist_ok=True)
 
     # Copy server content
+    created_dirs: Set[str] = {addon_output_dir}
     for src_file, dst_subpath in files_mapping:
         dst_path: str = os.path.join(addon_output_dir, dst_subpath)
-        dst_dir: str = os.path.dirname(dst_path)
-        os.makedirs(dst_dir, exist_ok=True)
         if isinstance(src_file, io.BytesIO):
+            _ensure_dir(os.path.dirname(dst_path), created_dirs)
             with open(dst_path, "wb") as stream:
-                stream.write(src_file.getvalue())
+                stream.write(src_file.getbuffer())
         else:
-            safe_copy_file(src_file, dst_path)
+            safe_copy_file(src_file, dst_path, created_dirs)
 
     log.info("Package copy finished")
 
@@ -440,13 +619,33 @@ def create_addon_package(
         output_dir, f"{ADDON_NAME}-{ADDON_VERSION}.zip"
     )
 
-    with ZipFileLongPaths(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        # Copy server content
-        for src_file, dst_subpath in files_mapping:
-            if isinstance(src_file, io.BytesIO):
-                zipf.writestr(dst_subpath, src_file.getvalue())
-            else:
-                zipf.write(src_file, dst_subpath)
+    with open(
+        output_path, "wb", buffering=ZIP_WRITE_BUFFER_SIZE
+    ) as stream:
+        with ZipFileLongPaths(
+            stream,
+            "w",
+            zipfile.ZIP_DEFLATED,
+            compresslevel=ZIP_COMPRESS_LEVEL
+        ) as zipf:
+            # Copy server content
+            for src_file, dst_subpath in files_mapping:
+                if isinstance(src_file, io.BytesIO):
+                    # in-memory content is already compressed client zip,
+                    #   compressing it again only costs time
+                    zipf.writestr(
+                        dst_subpath,
+                        src_file.getbuffer(),
+                        compress_type=zipfile.ZIP_STORED
+                    )
+                elif dst_subpath.lower().endswith(STORED_EXTENSIONS):
+                    zipf.write(
+                        src_file,
+                        dst_subpath,
+                        compress_type=zipfile.ZIP_STORED
+                    )
+                else:
+                    zipf.write(src_file, dst_subpath)
 
     log.info("Package created")
 
@@ -454,7 +653,8 @@ def create_addon_package(
 def main(
     output_dir: Optional[str] = None,
     skip_zip: Optional[bool] = False,
-    only_client: Optional[bool] = False
+    only_client: Optional[bool] = False,
+    force_frontend: Optional[bool] = False
 ):
     log: logging.Logger = logging.getLogger("create_package")
     log.info("Package creation started")
@@ -485,7 +685,10 @@ def main(
 
     if os.path.exists(FRONTEND_ROOT):
         update_frontend_version(log)
-        build_frontend()
+        if not force_frontend and is_frontend_dist_fresh():
+            log.info("Frontend build is up to date. Skipping build")
+        else:
+            build_frontend()
 
     files_mapping: List[FileMapping] = []
     files_mapping.extend(get_base_files_mapping())
@@ -533,6 +736,12 @@ if __name__ == "__main__":
             " Requires '-o', '--output' argument to be filled."
         )
     )
+    parser.add_argument(
+        "--force-frontend",
+        dest="force_frontend",
+        action="store_true",
+        help="Build frontend even if build output is up to date."
+    )
     parser.add_argument(
         "--debug",
         dest="debug",
@@ -545,4 +754,9 @@ if __name__ == "__main__":
     if args.debug:
         level = logging.DEBUG
     logging.basicConfig(level=level)
-    main(args.output_dir, args.skip_zip, args.only_client)
+    main(
+        args.output_dir,
+        args.skip_zip,
+        args.only_client,
+        args.force_frontend
+    )
@@ -1,7 +1,9 @@
 from __future__ import annotations
+import asyncio
+import time
 from typing import Any, Type
 from nxtools import logging
-import os
+from asyncpg.exceptions import UndefinedTableError
 from fastapi import Path, Query, Response
 
 from ayon_server.addons import BaseServerAddon
@@ -14,22 +16,42 @@ from ayon_server.api.dependencies import (
 )
 
 from ayon_server.entities.representation import RepresentationEntity
+from ayon_server.exceptions import BadRequestException, ForbiddenException
 from ayon_server.lib.postgres import Postgres
 from ayon_server.utils import SQLTool
 
 from .settings.settings import SiteSyncSettings
 from .settings.models import (
     FileModel,
+    RepresentationStateBulkModel,
+    RepresentationStateBulkResultModel,
     RepresentationStateModel,
     SiteSyncParamsModel,
+    SiteSyncRemoveModel,
+    SiteSyncRemovedModel,
     SiteSyncSummaryItem,
     SiteSyncSummaryModel,
     SortByEnum,
     StatusEnum,
     SyncStatusModel,
+    SITE_NAME_REGEX,
 )
 
 
+# projects where 'sitesync_files_status' table was already created
+_checked_sync_status_tables: set[str] = set()
+
+# how long are folder access lists of user reused (in sec), kept short as
+#   changes of access groups are not propagated here
+FOLDER_ACCESS_CACHE_TTL = 10
+FOLDER_ACCESS_CACHE_SIZE = 1024
+# site settings loaded at once, keeps free connections in database pool
+SITE_SETTINGS_CONCURRENCY = 8
+# site holding published files, never cleared as a whole
+STUDIO_SITE = "studio"
+_folder_access_cache: dict[tuple[str, str], tuple[float, Any]] = {}
+
+
 class SiteSync(BaseServerAddon):
     settings_model: Type[SiteSyncSettings] = SiteSyncSettings
 
@@ -55,6 +77,12 @@ class SiteSync(BaseServerAddon):
             method="GET",
         )
 
+        self.add_endpoint(
+            "/{project_name}/state",
+            self.set_site_sync_representations_state,
+            method="POST",
+        )
+
         self.add_endpoint(
             "/{project_name}/state/{representation_id}/{site_name}",  # noqa
             self.set_site_sync_representation_state,
@@ -67,6 +95,18 @@ class SiteSync(BaseServerAddon):
             method="DELETE",
         )
 
+        self.add_endpoint(
+            "/{project_name}/state/{site_name}",
+            self.remove_site_sync_site_state,
+            method="DELETE",
+        )
+
+        self.add_endpoint(
+            "/{project_name}/remove_site/{site_name}",
+            self.remove_site_sync_representations_state,
+            method="POST",
+        )
+
     #
     # GET SITE SYNC PARAMS
     #
@@ -77,29 +117,40 @@ class SiteSync(BaseServerAddon):
         user: CurrentUser,
     ) -> SiteSyncParamsModel:
 
-        access_list = await folder_access_list(user, project_name, "read")
-        conditions = []
-        if access_list is not None:
-            conditions.append(f"h.path like ANY ('{{ {','.join(access_list)} }}')")
-
-        query = f"""
-            SELECT
-                DISTINCT(r.name) as name,
-                COUNT (*) OVER () as total_count
-            FROM project_{project_name}.representations as r
-            INNER JOIN project_{project_name}.versions as v
-                ON r.version_id = v.id
-            INNER JOIN project_{project_name}.products as p
-                ON v.product_id = p.id
-            INNER JOIN project_{project_name}.hierarchy as h
-                ON p.folder_id = h.id
-            {SQLTool.conditions(conditions)}
-        """
+        access_list = await get_folder_access_list(user, project_name)
+        args = []
+        # one row per name with count of its representations, total count
+        #   is sum of them, no window over all rows is needed
+        if access_list is None:
+            # user can see all folders, joins to folder path are not needed
+            query = f"""
+                SELECT
+                    r.name as name,
+                    COUNT(*) as name_count
+                FROM project_{project_name}.representations as r
+                GROUP BY r.name
+            """
+        else:
+            args.append(access_list)
+            query = f"""
+                SELECT
+                    r.name as name,
+                    COUNT(*) as name_count
+                FROM project_{project_name}.representations as r
+                INNER JOIN project_{project_name}.versions as v
+                    ON r.version_id = v.id
+                INNER JOIN project_{project_name}.products as p
+                    ON v.product_id = p.id
+                INNER JOIN project_{project_name}.hierarchy as h
+                    ON p.folder_id = h.id
+                WHERE h.path LIKE ANY($1::varchar[])
+                GROUP BY r.name
+            """
 
         total_count = 0
         names = []
-        async for row in Postgres.iterate(query):
-            total_count = row["total_count"] or 0
+        async for row in Postgres.iterate(query, *args):
+            total_count += row["name_count"]
             names.append(row["name"])
 
         return SiteSyncParamsModel(count=total_count, names=names)
@@ -113,22 +164,37 @@ class SiteSync(BaseServerAddon):
         project_name: ProjectName,
         user: CurrentUser,
     ) -> dict[str, list[str]]:
-        sites = {"active_site": [], "remote_site": []}
+        # sets as many machines usually share same remote site
+        sites = {"active_site": set(), "remote_site": set()}
         site_infos = await Postgres.fetch("select id, data from sites")
-        for site_info in site_infos:
-            settings = await self.get_project_site_settings(
-                project_name, user.name, site_info["id"]
-            )
-            for site_type in ["active_site", "remote_site"]:
-                used_site = settings.dict()["local_setting"][site_type]
+        semaphore = asyncio.Semaphore(SITE_SETTINGS_CONCURRENCY)
+
+        async def get_site_settings(site_id):
+            async with semaphore:
+                return await self.get_project_site_settings(
+                    project_name, user.name, site_id
+                )
+
+        all_settings = await asyncio.gather(*(
+            get_site_settings(site_info["id"])
+            for site_info in site_infos
+        ))
+        for site_info, settings in zip(site_infos, all_settings):
+            # attribute access, 'dict()' would convert whole settings tree
+            local_setting = settings.local_setting
+            for site_type, used_sites in sites.items():
+                used_site = getattr(local_setting, site_type)
                 if not used_site:
                     continue
 
                 if used_site == "local":
-                    sites[site_type].append(site_info["id"])
+                    used_sites.add(site_info["id"])
                 else:
-                    sites[site_type].append(used_site)
-        return sites
+                    used_sites.add(used_site)
+        return {
+            site_type: list(used_sites)
+            for site_type, used_sites in sites.items()
+        }
 
 
     #
@@ -217,39 +283,56 @@ class SiteSync(BaseServerAddon):
         """
         await check_sync_status_table(project_name)
         conditions = []
+        # values are passed as query arguments, so query text is the same
+        #   for different filter values and its plan can be reused
+        args = [localSite, remoteSite]
+
+        def add_condition(condition, value):
+            args.append(value)
+            conditions.append(condition.format(f"${len(args)}"))
 
         if representationIds is not None:
-            conditions.append(f"r.id IN {SQLTool.array(representationIds)}")
+            add_condition("r.id = ANY({}::uuid[])", representationIds)
 
         if folderFilter:
-            conditions.append(f"f.name ILIKE '%{folderFilter}%'")
+            add_condition("f.name ILIKE {}", f"%{folderFilter}%")
 
         if folderIdsFilter:
-            conditions.append(f"f.id IN {SQLTool.array(folderIdsFilter)}")
+            add_condition("f.id = ANY({}::uuid[])", folderIdsFilter)
 
         if productFilter:
-            conditions.append(f"p.name ILIKE '%{productFilter}%'")
+            add_condition("p.name ILIKE {}", f"%{productFilter}%")
 
         if versionFilter:
-            conditions.append(f"v.version = {versionFilter}")
+            add_condition("v.version = {}", versionFilter)
 
         if versionIdsFilter:
-            conditions.append(f"v.id IN {SQLTool.array(versionIdsFilter)}")
+            add_condition("v.id = ANY({}::uuid[])", versionIdsFilter)
 
         if localStatusFilter:
-            statusFilter = [str(s.value) for s in localStatusFilter]
-            conditions.append(f"local.status IN ({','.join(statusFilter)})")
+            add_condition(
+                "local.status = ANY({}::integer[])",
+                [s.value for s in localStatusFilter]
+            )
 
         if remoteStatusFilter:
-            statusFilter = [str(s.value) for s in remoteStatusFilter]
-            conditions.append(f"remote.status IN ({','.join(statusFilter)})")
+            add_condition(
+                "remote.status = ANY({}::integer[])",
+                [s.value for s in remoteStatusFilter]
+            )
 
         if repreNameFilter:
-            conditions.append(f"r.name IN {SQLTool.array(repreNameFilter)}")
+            add_condition("r.name = ANY({}::varchar[])", repreNameFilter)
 
-        access_list = await folder_access_list(user, project_name, "read")
+        access_list = await get_folder_access_list(user, project_name)
         if access_list is not None:
-            conditions.append(f"path like ANY ('{{ {','.join(access_list)} }}')")
+            add_condition("h.path LIKE ANY({}::varchar[])", access_list)
+
+        # pagination is passed as arguments too, pages share query text
+        args.append(pageLength)
+        limit_arg = f"${len(args)}"
+        args.append((page - 1) * pageLength)
+        offset_arg = f"${len(args)}"
 
         sites_join = "LEFT"
         if bothOnly:
@@ -287,36 +370,41 @@ class SiteSync(BaseServerAddon):
             {sites_join} JOIN
                 project_{project_name}.sitesync_files_status as local
                 ON local.representation_id = r.id
-                AND local.site_name = '{localSite}'
+                AND local.site_name = $1
             {sites_join} JOIN
                 project_{project_name}.sitesync_files_status as remote
                 ON remote.representation_id = r.id
-                AND remote.site_name = '{remoteSite}'
+                AND remote.site_name = $2
 
             {SQLTool.conditions(conditions)}
 
             ORDER BY {sortBy.value} {'DESC' if sortDesc else 'ASC'}
-            LIMIT {pageLength}
-            OFFSET { (page-1) * pageLength }
+            LIMIT {limit_arg}
+            OFFSET {offset_arg}
         """
         repres = []
 
-        async for row in Postgres.iterate(query):
+        try:
+            rows = [row async for row in Postgres.iterate(query, *args)]
+        except UndefinedTableError:
+            # project was probably recreated, create table on next request
+            _checked_sync_status_tables.discard(project_name)
+            raise
+
+        for row in rows:
             files = row["representation_files"]
             file_count = len(files)
-            total_size = sum([f.get("size") for f in files])
+            total_size = sum(f.get("size") for f in files)
 
             ldata = row["local_data"] or {}
             lfiles = ldata.get("files", {})
-            lsize = sum([f.get("size") for f in lfiles.values()] or [0])
-            ltime = max([f.get("timestamp") for f in lfiles.values()] or [0])
+            lsize, ltime = get_files_size_and_timestamp(lfiles)
 
             rdata = row["remote_data"] or {}
             rfiles = rdata.get("files", {})
-            rsize = sum([f.get("size") for f in rfiles.values()] or [0])
-            rtime = max([f.get("timestamp") for f in rfiles.values()] or [0])
+            rsize, rtime = get_files_size_and_timestamp(rfiles)
 
-            local_status = SyncStatusModel(
+            local_status = SyncStatusModel.construct(
                 status=StatusEnum.NOT_AVAILABLE
                 if row["localstatus"] is None
                 else row["localstatus"],
@@ -324,7 +412,7 @@ class SiteSync(BaseServerAddon):
                 size=lsize,
                 timestamp=ltime,
             )
-            remote_status = SyncStatusModel(
+            remote_status = SyncStatusModel.construct(
                 status=StatusEnum.NOT_AVAILABLE
                 if row["remotestatus"] is None
                 else row["remotestatus"],
@@ -340,13 +428,13 @@ class SiteSync(BaseServerAddon):
                 remote_file = rfiles.get(file_id, {})
 
                 file_list.append(
-                    FileModel(
+                    FileModel.construct(
                         id=file_id,
                         fileHash=file_info["hash"],
                         size=file_info["size"],
                         path=file_info["path"],
-                        baseName=os.path.split(file_info["path"])[1],
-                        localStatus=SyncStatusModel(
+                        baseName=file_info["path"].rpartition("/")[2],
+                        localStatus=SyncStatusModel.construct(
                             status=local_file.get("status",
                                                 StatusEnum.NOT_AVAILABLE),
                             size=local_file.get("size", 0),
@@ -355,7 +443,7 @@ class SiteSync(BaseServerAddon):
                             message=local_file.get("message", None),
                             retries=local_file.get("retries", 0),
                         ),
-                        remoteStatus=SyncStatusModel(
+                        remoteStatus=SyncStatusModel.construct(
                             status=remote_file.get("status",
                                                 StatusEnum.NOT_AVAILABLE),
                             size=remote_file.get("size", 0),
@@ -383,7 +471,7 @@ class SiteSync(BaseServerAddon):
                 )
             )
 
-        return SiteSyncSummaryModel(representations=repres)
+        return SiteSyncSummaryModel.construct(representations=repres)
 
 
     #
@@ -408,92 +496,52 @@ class SiteSync(BaseServerAddon):
         """
         await check_sync_status_table(project_name)
 
-        priority = post_data.priority
-
         async with Postgres.acquire() as conn:
             async with conn.transaction():
-                query = (
-                    f"""
-                    SELECT priority, data
-                    FROM project_{project_name}.sitesync_files_status
-                    WHERE representation_id = $1 AND site_name = $2
-                    FOR UPDATE
-                    """,
-                    representation_id,
-                    site_name,
+                await set_representation_state(
+                    conn, project_name, representation_id, site_name, post_data
                 )
 
-                result = await conn.fetch(*query)
-                do_insert = False
-                if not result:
-                    do_insert = True
-                    repre = await RepresentationEntity.load(
-                        project_name, representation_id, transaction=conn
-                    )
+        return Response(status_code=204)
 
-                    files = {}
-                    for file_info in repre._payload.files:
-                        fhash = file_info.hash
-                        files[file_info.id] = {
-                            "hash": fhash,
-                            "status": StatusEnum.NOT_AVAILABLE,
-                            "size": 0,
-                            "timestamp": 0,
-                        }
-                else:
-                    files = result[0]["data"].get("files")
-                    if priority is None:
-                        priority = result[0]["priority"]
-
-                for posted_file in post_data.files:
-                    posted_file_id = posted_file.id
-                    if posted_file_id not in files:
-                        logging.warning(f"{posted_file} not in files")
-                        continue
-                    files[posted_file_id]["timestamp"] = posted_file.timestamp
-                    files[posted_file_id]["status"] = posted_file.status
-                    files[posted_file_id]["size"] = posted_file.size
-
-                    if posted_file.message:
-                        files[posted_file_id]["message"] = posted_file.message
-                    elif "message" in files[posted_file_id]:
-                        del files[posted_file_id]["message"]
-
-                    if posted_file.retries:
-                        files[posted_file_id]["retries"] = posted_file.retries
-                    elif "retries" in files[posted_file_id]:
-                        del files[posted_file_id]["retries"]
-
-                status = get_overal_status(files)
-
-                if do_insert:
-                    await conn.execute(
-                        f"""
-                        INSERT INTO project_{project_name}.sitesync_files_status
-                        (representation_id, site_name, status, priority, data)
-                        VALUES ($1, $2, $3, $4, $5)
-                        """,
-                        representation_id,
-                        site_name,
-                        status,
-                        post_data.priority if post_data.priority is not None else 50,
-                        {"files": files},
-                    )
-                else:
-                    await conn.execute(
-                        f"""
-                        UPDATE project_{project_name}.sitesync_files_status
-                        SET status = $1, data = $2, priority = $3
-                        WHERE representation_id = $4 AND site_name = $5
-                        """,
-                        status,
-                        {"files": files},
-                        priority,
-                        representation_id,
-                        site_name,
-                    )
+    async def set_site_sync_representations_state(
+        self,
+        post_data: RepresentationStateBulkModel,
+        project_name: ProjectName,
+        user: CurrentUser,
+    ) -> RepresentationStateBulkResultModel:
+        """Sets state of multiple representations on sites at once.
 
-        return Response(status_code=204)
+        Items are applied in order, used by client to send all updates of one
+        sync loop in one request. Each item is stored in its own savepoint,
+        item which cannot be stored (e.g. representation was deleted) does
+        not roll back the others and its id is returned.
+        """
+        await check_sync_status_table(project_name)
+
+        failed_ids = []
+        async with Postgres.acquire() as conn:
+            async with conn.transaction():
+                for item in post_data.items:
+                    try:
+                        async with conn.transaction():
+                            await set_representation_state(
+                                conn,
+                                project_name,
+                                item.representationId,
+                                item.siteName,
+                                item,
+                            )
+                    except Exception as exc:
+                        logging.warning(
+                            f"Cannot set state of {item.representationId}"
+                            f" on {item.siteName}: {exc}"
+                        )
+                        failed_ids.append(item.representationId)
+
+        return RepresentationStateBulkResultModel(
+            failedRepresentationIds=failed_ids
+        )
 
     async def remove_site_sync_representation_state(
         self,
@@ -504,42 +552,276 @@ class SiteSync(BaseServerAddon):
     ) -> Response:
         await check_sync_status_table(project_name)
 
-        async with Postgres.acquire() as conn:
-            async with conn.transaction():
-                query = (
-                    f"""
-                    DELETE
-                    FROM project_{project_name}.sitesync_files_status
-                    WHERE representation_id = $1 AND site_name = $2
-                    """,
-                    representation_id,
-                    site_name,
+        # single statement, does not need explicit transaction
+        query = (
+            f"""
+            DELETE
+            FROM project_{project_name}.sitesync_files_status
+            WHERE representation_id = $1 AND site_name = $2
+            """,
+            representation_id,
+            site_name,
+        )
+
+        await Postgres.execute(*query)
+
+        return Response(status_code=204)
+
+    async def remove_site_sync_site_state(
+        self,
+        project_name: ProjectName,
+        user: CurrentUser,
+        site_name: str = Path(..., regex=SITE_NAME_REGEX),
+    ) -> SiteSyncRemovedModel:
+        """Removes site from all representations in project.
+
+        Returns ids of affected representations so caller could clean up
+        local files without querying all representations.
+        """
+        user.check_project_access(project_name)
+        if site_name == STUDIO_SITE:
+            raise BadRequestException(f"Cannot clear '{site_name}' site")
+
+        # state of all users is removed, others can clear only own sites
+        if not user.is_manager:
+            query = (
+                "SELECT id FROM sites WHERE id = $1 AND data->'users' ? $2",
+                site_name,
+                user.name,
+            )
+            if not await Postgres.fetch(*query):
+                raise ForbiddenException(
+                    "Only managers can clear sites of other users"
                 )
 
-                await conn.fetch(*query)
+        await check_sync_status_table(project_name)
+
+        query = (
+            f"""
+            DELETE
+            FROM project_{project_name}.sitesync_files_status
+            WHERE site_name = $1
+            RETURNING representation_id
+            """,
+            site_name,
+        )
+
+        result = await Postgres.fetch(*query)
+        representation_ids = [row["representation_id"] for row in result]
+        return SiteSyncRemovedModel(representationIds=representation_ids)
+
+    async def remove_site_sync_representations_state(
+        self,
+        post_data: SiteSyncRemoveModel,
+        project_name: ProjectName,
+        user: CurrentUser,
+        site_name: str = Path(..., regex=SITE_NAME_REGEX),
+    ) -> SiteSyncRemovedModel:
+        """Removes site from multiple representations at once.
+
+        Returns ids of representations which had the site.
+        """
+        user.check_project_access(project_name)
+        if site_name == STUDIO_SITE:
+            raise BadRequestException(f"Cannot remove '{site_name}' site")
+
+        await check_sync_status_table(project_name)
+
+        if not post_data.representationIds:
+            return SiteSyncRemovedModel()
+
+        query = (
+            f"""
+            DELETE
+            FROM project_{project_name}.sitesync_files_status
+            WHERE site_name = $1
+            AND representation_id = ANY($2::uuid[])
+            RETURNING representation_id
+            """,
+            site_name,
+            post_data.representationIds,
+        )
+
+        result = await Postgres.fetch(*query)
+        representation_ids = [row["representation_id"] for row in result]
+        return SiteSyncRemovedModel(representationIds=representation_ids)
+
+
+async def get_folder_access_list(user, project_name: str) -> Any:
+    """Folder paths user can read, reused for pages of the same view.
+
+    Returns:
+        Union[list[str], None]: Folder path patterns or None if user has
+            access to all folders.
+    """
+    key = (user.name, project_name)
+    cached = _folder_access_cache.get(key)
+    if (
+        cached is not None
+        and time.monotonic() - cached[0] <= FOLDER_ACCESS_CACHE_TTL
+    ):
+        return cached[1]
+
+    access_list = await folder_access_list(user, project_name, "read")
+    if len(_folder_access_cache) >= FOLDER_ACCESS_CACHE_SIZE:
+        _folder_access_cache.clear()
+    _folder_access_cache[key] = (time.monotonic(), access_list)
+    return access_list
+
+
+async def set_representation_state(
+    conn,
+    project_name: str,
+    representation_id: str,
+    site_name: str,
+    post_data: RepresentationStateModel,
+) -> None:
+    """Stores state of representation files on site.
+
+    Must be called in transaction, row of representation is locked.
+    """
+    priority = post_data.priority
+
+    query = (
+        f"""
+        SELECT priority, data
+        FROM project_{project_name}.sitesync_files_status
+        WHERE representation_id = $1 AND site_name = $2
+        FOR UPDATE
+        """,
+        representation_id,
+        site_name,
+    )
+
+    try:
+        result = await conn.fetch(*query)
+    except UndefinedTableError:
+        _checked_sync_status_tables.discard(project_name)
+        raise
+    do_insert = False
+    if not result:
+        do_insert = True
+        repre = await RepresentationEntity.load(
+            project_name, representation_id, transaction=conn
+        )
+
+        files = {}
+        for file_info in repre._payload.files:
+            fhash = file_info.hash
+            files[file_info.id] = {
+                "hash": fhash,
+                "status": StatusEnum.NOT_AVAILABLE,
+                "size": 0,
+                "timestamp": 0,
+            }
+    else:
+        files = result[0]["data"].get("files")
+        if priority is None:
+            priority = result[0]["priority"]
+
+    for posted_file in post_data.files:
+        file_info = files.get(posted_file.id)
+        if file_info is None:
+            logging.warning(f"{posted_file} not in files")
+            continue
+        file_info["timestamp"] = posted_file.timestamp
+        file_info["status"] = posted_file.status
+        file_info["size"] = posted_file.size
+
+        if posted_file.message:
+            file_info["message"] = posted_file.message
+        else:
+            file_info.pop("message", None)
+
+        if posted_file.retries:
+            file_info["retries"] = posted_file.retries
+        else:
+            file_info.pop("retries", None)
+
+    status = get_overal_status(files)
+
+    if do_insert:
+        await conn.execute(
+            f"""
+            INSERT INTO project_{project_name}.sitesync_files_status
+            (representation_id, site_name, status, priority, data)
+            VALUES ($1, $2, $3, $4, $5)
+            """,
+            representation_id,
+            site_name,
+            status,
+            post_data.priority if post_data.priority is not None else 50,
+            {"files": files},
+        )
+    else:
+        await conn.execute(
+            f"""
+            UPDATE project_{project_name}.sitesync_files_status
+            SET status = $1, data = $2, priority = $3
+            WHERE representation_id = $4 AND site_name = $5
+            """,
+            status,
+            {"files": files},
+            priority,
+            representation_id,
+            site_name,
+        )
+
 
-                return Response(status_code=204)
+def get_files_size_and_timestamp(files: dict) -> tuple[int, int]:
+    """Total size and last timestamp of files on site in one pass."""
+    size = 0
+    timestamp = 0
+    for file_info in files.values():
+        size += file_info.get("size")
+        file_timestamp = file_info.get("timestamp")
+        if file_timestamp > timestamp:
+            timestamp = file_timestamp
+    return size, timestamp
 
 
 def get_overal_status(files: dict) -> StatusEnum:
-    all_states = [v.get("status", StatusEnum.NOT_AVAILABLE) for v in files.values()]
-    if all(stat == StatusEnum.NOT_AVAILABLE for stat in all_states):
+    # single pass, FAILED has priority over other states so loop can end
+    #   on first failed file
+    all_not_available = all_synced = all_queued = True
+    any_in_progress = any_paused = False
+    for file_info in files.values():
+        status = file_info.get("status", StatusEnum.NOT_AVAILABLE)
+        if status == StatusEnum.FAILED:
+            return StatusEnum.FAILED
+        if status != StatusEnum.NOT_AVAILABLE:
+            all_not_available = False
+        if status != StatusEnum.SYNCED:
+            all_synced = False
+        if status != StatusEnum.QUEUED:
+            all_queued = False
+        if status == StatusEnum.IN_PROGRESS:
+            any_in_progress = True
+        elif status == StatusEnum.PAUSED:
+            any_paused = True
+
+    if all_not_available:
         return StatusEnum.NOT_AVAILABLE
-    elif all(stat == StatusEnum.SYNCED for stat in all_states):
+    elif all_synced:
         return StatusEnum.SYNCED
-    elif any(stat == StatusEnum.FAILED for stat in all_states):
-        return StatusEnum.FAILED
-    elif any(stat == StatusEnum.IN_PROGRESS for stat in all_states):
+    elif any_in_progress:
         return StatusEnum.IN_PROGRESS
-    elif any(stat == StatusEnum.PAUSED for stat in all_states):
+    elif any_paused:
         return StatusEnum.PAUSED
-    elif all(stat == StatusEnum.QUEUED for stat in all_states):
+    elif all_queued:
         return StatusEnum.QUEUED
     return StatusEnum.NOT_AVAILABLE
 
 
 async def check_sync_status_table(project_name: str) -> None:
-    """Checks for existence of `sitesync_files_status` table, creates if not."""
+    """Checks for existence of `sitesync_files_status` table, creates if not.
+
+    Check is done only once per project in server process.
+    """
+    if project_name in _checked_sync_status_tables:
+        return
+    # all statements in one round trip, query without arguments can contain
+    #   multiple statements
     await Postgres.execute(
         f"CREATE TABLE IF NOT EXISTS project_{project_name}.sitesync_files_status ("
         f"""representation_id UUID NOT NULL REFERENCES project_{project_name}.representations(id) ON DELETE CASCADE,
@@ -549,6 +831,8 @@ async def check_sync_status_table(project_name: str) -> None:
             data JSONB NOT NULL DEFAULT '{{}}'::JSONB,
             PRIMARY KEY (representation_id, site_name)
         );"""
+        f"CREATE INDEX IF NOT EXISTS file_status_idx ON project_{project_name}.sitesync_files_status(status);"
+        f"CREATE INDEX IF NOT EXISTS file_priority_idx ON project_{project_name}.sitesync_files_status(priority desc);"
+        f"CREATE INDEX IF NOT EXISTS file_site_name_idx ON project_{project_name}.sitesync_files_status(site_name);"
     )
-    await Postgres.execute(f"CREATE INDEX IF NOT EXISTS file_status_idx ON project_{project_name}.sitesync_files_status(status);")
-    await Postgres.execute(f"CREATE INDEX IF NOT EXISTS file_priority_idx ON project_{project_name}.sitesync_files_status(priority desc);")
+    _checked_sync_status_tables.add(project_name)
@@ -1,8 +1,15 @@
 import enum
 import time
 
+from pydantic import constr
+
 from ayon_server.types import Field, OPModel
 
+# entity id as stored by server, uuid without dashes
+EntityID = constr(regex=r"^[0-9a-f]{32}$")
+# allowed site names, local site ids and names of configured sites
+SITE_NAME_REGEX = r"^[a-zA-Z0-9_.\-]+$"
+
 
 class StatusEnum(enum.IntEnum):
     """
@@ -87,6 +94,39 @@ class RepresentationStateModel(OPModel):
     priority: int | None = Field(None)
 
 
+class RepresentationStateBulkItemModel(RepresentationStateModel):
+    representationId: EntityID = Field(...)
+    siteName: str = Field(..., regex=SITE_NAME_REGEX)
+
+
+class RepresentationStateBulkModel(OPModel):
+    items: list[RepresentationStateBulkItemModel] = Field(
+        default_factory=list,
+        description="States of representations on sites, applied in order",
+    )
+
+
+class RepresentationStateBulkResultModel(OPModel):
+    failedRepresentationIds: list[str] = Field(
+        default_factory=list,
+        description="Ids of representations which state was not stored",
+    )
+
+
+class SiteSyncRemoveModel(OPModel):
+    representationIds: list[EntityID] = Field(
+        default_factory=list,
+        description="Ids of representations to remove the site from",
+    )
+
+
+class SiteSyncRemovedModel(OPModel):
+    representationIds: list[str] = Field(
+        default_factory=list,
+        description="Ids of representations removed from the site",
+    )
+
+
 class UserSyncSites(OPModel):
     localSite: str = Field(...)
     remoteSite: str = Field(...)
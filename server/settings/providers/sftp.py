@@ -2,14 +2,7 @@ from pydantic import Field
 
 from ayon_server.settings import BaseSettingsModel
 
-
-class CredPathPerPlatform(BaseSettingsModel):
-    windows: list[str] = Field(default_factory=list,
-                               scope=["studio", "project", "site"],)
-    linux: list[str] = Field(default_factory=list,
-                             scope=["studio", "project", "site"],)
-    darwin: list[str] = Field(default_factory=list,
-                              scope=["studio", "project", "site"],)
+from .gdrive import CredPathPerPlatform
 
 
 class SFTPSubmodel(BaseSettingsModel):
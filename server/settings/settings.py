@@ -1,9 +1,11 @@
+import time
 import typing
+import asyncio
+from collections import OrderedDict
 from pydantic import Field, validator
 
 from ayon_server.settings import (
     BaseSettingsModel,
-    ensure_unique_names,
     normalize_name,
 )
 
@@ -48,10 +50,28 @@ class RootSubmodel(BaseSettingsModel):
     )
 
 
-default_roots = [
-    RootSubmodel(
-        name="work",
-        path="C:/projects_local",
+def default_roots_factory():
+    """Default local roots, new list is created for each settings instance.
+
+    Fresh list is cheaper than deep copy of shared default done by pydantic
+    on every instantiation.
+    """
+    return [
+        RootSubmodel.construct(
+            name="work",
+            path="C:/projects_local",
+        )
+    ]
+
+
+# Items of provider enumerator, built once and shared
+provider_enum = [
+    {"value": key, "label": label}
+    for key, label in (
+        ("gdrive", "Google Drive"),
+        ("local_drive", "Local Drive"),
+        ("dropbox", "Dropbox"),
+        ("sftp", "SFTP"),
     )
 ]
 
@@ -62,14 +82,18 @@ def provider_resolver():
     Returning a list of dicts is used to allow for a custom label to be
     displayed in the UI.
     """
-    provider_dict = {
-        "gdrive": "Google Drive",
-        "local_drive": "Local Drive",
-        "dropbox": "Dropbox",
-        "sftp": "SFTP"
-    }
-    return [{"value": f"{key}", "label": f"{label}"}
-            for key, label in provider_dict.items()]
+    return provider_enum
+
+
+# how long are resolved site names reused (in sec), multiple site
+#   enumerators of one settings form are resolved at the same time
+SITE_NAMES_CACHE_TTL = 5
+# resolved keys kept, expired entries stay as fallback until replaced
+SITE_NAMES_CACHE_SIZE = 128
+_site_names_cache: "OrderedDict[tuple, tuple[float, list[str]]]" = (
+    OrderedDict()
+)
+_site_names_locks: dict[tuple, asyncio.Lock] = {}
 
 
 async def defined_sited_enum_resolver(
@@ -81,6 +105,47 @@ async def defined_sited_enum_resolver(
     if addon is None:
         return []
 
+    key = (addon.version, settings_variant, project_name)
+    lock = _site_names_locks.get(key)
+    if lock is None:
+        lock = _site_names_locks[key] = asyncio.Lock()
+
+    async with lock:
+        cached = _site_names_cache.get(key)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < SITE_NAMES_CACHE_TTL
+        ):
+            return list(cached[1])
+
+        try:
+            sites = await _get_defined_site_names(
+                addon, settings_variant, project_name
+            )
+        except Exception:
+            # settings could not be loaded, last known sites are better
+            #   than broken settings form
+            if cached is None:
+                _site_names_locks.pop(key, None)
+                raise
+            return list(cached[1])
+
+        _site_names_cache[key] = (time.monotonic(), sites)
+        _site_names_cache.move_to_end(key)
+        # least recently resolved keys are dropped with their locks
+        while len(_site_names_cache) > SITE_NAMES_CACHE_SIZE:
+            old_key, _ = _site_names_cache.popitem(last=False)
+            old_lock = _site_names_locks.get(old_key)
+            if old_lock is not None and not old_lock.locked():
+                del _site_names_locks[old_key]
+    return list(sites)
+
+
+async def _get_defined_site_names(
+    addon: "BaseServerAddon",
+    settings_variant: str,
+    project_name: str | None,
+) -> list[str]:
     if project_name:
         settings = await addon.get_project_settings(project_name=project_name,
                                                     variant=settings_variant)
@@ -94,9 +159,6 @@ async def defined_sited_enum_resolver(
     return sites
 
 
-provider_enum = provider_resolver()
-
-
 class SitesSubmodel(BaseSettingsModel):
     """Configured additional sites and properties for their providers"""
     _layout = "expanded"
@@ -114,7 +176,7 @@ class SitesSubmodel(BaseSettingsModel):
         "",
         title="Provider",
         description="Switch between providers",
-        enum_resolver=lambda: provider_enum,
+        enum_resolver=provider_resolver,
         conditionalEnum=True
     )
 
@@ -157,7 +219,7 @@ class LocalSubmodel(BaseSettingsModel):
                              enum_resolver=defined_sited_enum_resolver)
 
     local_roots: list[RootSubmodel] = Field(
-        default=default_roots,
+        default_factory=default_roots_factory,
         title="Local roots overrides",
         scope=["site"],
         description="Overrides for local root(s)."
@@ -189,5 +251,10 @@ class SiteSyncSettings(BaseSettingsModel):
     @validator("sites")
     def ensure_unique_names(cls, value):
         """Ensure name fields within the lists have unique names."""
-        ensure_unique_names(value)
+        # set lookup, validator runs on every load of settings
+        names = set()
+        for site in value:
+            if site.name in names:
+                raise ValueError(f"Duplicate name {site.name}")
+            names.add(site.name)
         return value